@@ -107,18 +107,20 @@ class BackendClient(BaseApiClient):
         return await cls._create_person(update, context)
 
     @classmethod
-    def get_age_ranges(cls) -> typing.Any:
+    async def get_age_ranges(cls, client: httpx.AsyncClient) -> typing.Any:
         # TODO typing.Any should be replaced with something meaningful, but it leads to numerous
         #  mypy issues (here and in other methods).
-        return cls.get_simple(API_URL_AGE_RANGES)
+        return await cls.get_simple(client, API_URL_AGE_RANGES)
 
     @classmethod
-    def get_assessments(cls, lang_code: str) -> typing.Any:
-        return cls.get_simple(API_URL_ENROLLMENT_TESTS, params={"language": lang_code})
+    async def get_assessments(cls, client: httpx.AsyncClient, lang_code: str) -> typing.Any:
+        return await cls.get_simple(
+            client, API_URL_ENROLLMENT_TESTS, params={"language": lang_code}
+        )
 
     @classmethod
-    def get_day_and_time_slots(cls) -> typing.Any:
-        return cls.get_simple(API_URL_DAY_AND_TIME_SLOTS)
+    async def get_day_and_time_slots(cls, client: httpx.AsyncClient) -> typing.Any:
+        return await cls.get_simple(client, API_URL_DAY_AND_TIME_SLOTS)
 
     @classmethod
     async def get_helpdesk_conversation_id(
@@ -170,8 +172,8 @@ class BackendClient(BaseApiClient):
         return chatwoot_conversation_id
 
     @classmethod
-    def get_languages_and_levels(cls) -> typing.Any:
-        return cls.get_simple(API_URL_LANGUAGES_AND_LEVELS)
+    async def get_languages_and_levels(cls, client: httpx.AsyncClient) -> typing.Any:
+        return await cls.get_simple(client, API_URL_LANGUAGES_AND_LEVELS)
 
     @classmethod
     async def get_level_after_assessment(
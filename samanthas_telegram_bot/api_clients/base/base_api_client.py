@@ -26,8 +26,8 @@ class BaseApiClient:
     """Base class for making API requests.
 
     Implements GET and POST methods that take update and context and provide extended
-    functionality and require ``update`` and ``context``, as well as simple synchronous GET
-    requests.
+    functionality and require ``update`` and ``context``, as well as simple GET requests
+    that don't need them.
     """
 
     @classmethod
@@ -60,11 +60,17 @@ class BaseApiClient:
         )
 
     @staticmethod
-    def get_simple(
-        url: str, headers: dict[str, str] | None = None, params: dict[str, str] | None = None
+    async def get_simple(
+        client: httpx.AsyncClient,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: dict[str, str] | None = None,
     ) -> DataDict | list[DataDict]:
-        """A simple method for a synchronous GET request, not needing update or context."""
-        response = httpx.get(url, headers=headers, params=params)
+        """A simple method for a GET request, not needing update or context.
+
+        The ``client`` is passed in so that several requests can share its connection pool.
+        """
+        response = await client.get(url, headers=headers, params=params)
         return response.json()
 
     @classmethod
@@ -73,7 +73,9 @@ class ChatwootClient(BaseApiClient):
             )
             logger.debug(
                 "Data received from Chatwoot after attempting to send a message to conversation "
-                f"{conversation_id}: {data}"
+                "%s: %s",
+                conversation_id,
+                data,
             )
         except BaseApiClientError as err:
             raise ChatwootRequestError(
@@ -1,14 +1,31 @@
 """Functionality for API queries and other operations necessary for loading BotData."""
 
+import asyncio
 import csv
 import logging
 import typing
 from pathlib import Path
 
+import httpx
+from telegram import (
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    KeyboardButton,
+    ReplyKeyboardMarkup,
+)
+
 from samanthas_telegram_bot.api_clients import BackendClient
-from samanthas_telegram_bot.data_structures.constants import LOCALES
+from samanthas_telegram_bot.conversation.auxil.enums import CommonCallbackData
+from samanthas_telegram_bot.data_structures.constants import (
+    LOCALES,
+    NON_TEACHING_HELP_TYPES,
+    STUDENT_COMMUNICATION_LANGUAGE_CODES,
+    TEACHER_PEER_HELP_TYPES,
+)
 from samanthas_telegram_bot.data_structures.context_types import BotData
-from samanthas_telegram_bot.data_structures.enums import AgeRangeType
+from samanthas_telegram_bot.data_structures.enums import AgeRangeType, Role
+from samanthas_telegram_bot.data_structures.helpers import get_review_categories
+from samanthas_telegram_bot.data_structures.literal_types import Locale
 from samanthas_telegram_bot.data_structures.models import (
     AgeRange,
     Assessment,
@@ -21,6 +38,15 @@ from samanthas_telegram_bot.data_structures.models import (
 
 logger = logging.getLogger(__name__)
 
+_BOT_PHRASE_ID_FOR_TEACHER_AGE_FROM = {
+    5: "option_young_children",
+    9: "option_older_children",
+    13: "option_adolescents",
+    18: "option_adults",
+    66: "option_seniors",
+}
+"""Matches lower bound of an age range for teachers to ID of the bot phrase describing it."""
+
 
 class BotDataLoader:
     """Class for loading bot data from backend or external files.
@@ -29,23 +55,42 @@ class BotDataLoader:
     """
 
     @classmethod
-    def load(cls, bot_data: BotData) -> None:
+    async def load(cls, bot_data: BotData) -> None:
         """Load bot data from backend or external file(s)."""
 
         logger.info("Loading data for bot initialization from backend")
 
-        bot_data.age_ranges_for_type = cls._get_age_ranges()
-
-        bot_data.assessment_for_age_range_id = cls._get_assessments(lang_code="en")
+        # The requests (and reading of the phrases file) don't depend on each other,
+        # so they are made concurrently, sharing one connection pool.
+        async with httpx.AsyncClient() as client:
+            (
+                age_ranges_for_type,
+                bot_data.assessment_for_age_range_id,
+                day_and_time_slots,
+                languages_and_levels,
+                phrases,
+            ) = await asyncio.gather(
+                cls._get_age_ranges(client),
+                cls._get_assessments(client, lang_code="en"),
+                cls._get_day_and_time_slots(client),
+                cls._get_languages_and_levels(client),
+                asyncio.to_thread(cls._load_phrases),
+            )
+        bot_data.age_ranges_for_type = age_ranges_for_type
+        bot_data.phrases = phrases
 
-        day_and_time_slots = cls._get_day_and_time_slots()
+        # Slots keep the order in which the backend returned them. They are not sorted by UTC hour:
+        # with the user's UTC offset, a slot can move past midnight, so that order would not match
+        # the local time shown on the buttons.
         bot_data.day_and_time_slot_for_slot_id = {slot.id: slot for slot in day_and_time_slots}
-        bot_data.day_and_time_slots_for_day_index = {
-            index: tuple(slot for slot in day_and_time_slots if slot.day_of_week_index == index)
-            for index in range(7)
-        }
+        # a list for each day of the week is preallocated, so slots are distributed in one pass
+        slots_for_day_index: list[list[DayAndTimeSlot]] = [[] for _ in range(7)]
+        for slot in day_and_time_slots:
+            slots_for_day_index[slot.day_of_week_index].append(slot)
+        bot_data.day_and_time_slots_for_day_index = tuple(
+            tuple(slots) for slots in slots_for_day_index
+        )
 
-        languages_and_levels = cls._get_languages_and_levels()
         unique_language_ids = {item.language_id for item in languages_and_levels}
         bot_data.sorted_language_ids = ["en"] + sorted(unique_language_ids - {"en"})
         bot_data.language_and_level_for_id = {item.id: item for item in languages_and_levels}
@@ -61,11 +106,15 @@ class BotDataLoader:
             (item.language_id, item.level): item.id for item in languages_and_levels
         }
 
-        bot_data.phrases = cls._load_phrases()
+        bot_data.phrases_for_locale = {
+            locale: {phrase_id: phrase[locale] for phrase_id, phrase in phrases.items()}
+            for locale in LOCALES
+        }
+        bot_data.greeting_template = cls._make_greeting_template(phrases)
+        cls._make_static_keyboards(bot_data, phrases, age_ranges_for_type)
 
         bot_data.student_ages_for_age_range_id = {
-            age_range.id: age_range
-            for age_range in bot_data.age_ranges_for_type[AgeRangeType.STUDENT]
+            age_range.id: age_range for age_range in age_ranges_for_type[AgeRangeType.STUDENT]
         }
 
         # initialize dictionary if nothing was loaded from persistence
@@ -73,7 +122,9 @@ class BotDataLoader:
             bot_data.conversation_mode_for_chat_id = {}
 
     @classmethod
-    def _get_age_ranges(cls) -> dict[AgeRangeType, tuple[AgeRange, ...]]:
+    async def _get_age_ranges(
+        cls, client: httpx.AsyncClient
+    ) -> dict[AgeRangeType, tuple[AgeRange, ...]]:
         """Get age ranges from the backend, assign IDs (for bot phrases) to age ranges for teacher.
 
         Reasoning for assigning bot phrase IDs to age ranges: Bot asks the teacher about students'
@@ -86,7 +137,7 @@ class BotDataLoader:
         """
 
         logger.info("Loading age ranges")
-        data = BackendClient.get_age_ranges()
+        data = await BackendClient.get_age_ranges(client)
 
         age_ranges: dict[AgeRangeType, tuple[AgeRange, ...]] = {
             type_: tuple(AgeRange(**item) for item in data if item["type"] == type_)
@@ -94,27 +145,22 @@ class BotDataLoader:
         }
 
         # add IDs of bot phrases to teachers' age ranges
-        age_to_phrase_id = {
-            5: "young_children",
-            9: "older_children",
-            13: "adolescents",
-            18: "adults",
-            66: "seniors",
-        }
         for age_range in age_ranges[AgeRangeType.TEACHER]:
-            age_range.bot_phrase_id = f"option_{age_to_phrase_id[age_range.age_from]}"
+            age_range.bot_phrase_id = _BOT_PHRASE_ID_FOR_TEACHER_AGE_FROM[age_range.age_from]
 
         return age_ranges
 
     @classmethod
-    def _get_assessments(cls, lang_code: str) -> dict[int, Assessment]:
+    async def _get_assessments(
+        cls, client: httpx.AsyncClient, lang_code: str
+    ) -> dict[int, Assessment]:
         """Gets assessment questions from the backend, based on language.
 
         Returns a dictionary matching an age range ID to assessment.
         """
 
         logger.info(f"Loading assessments for {lang_code=}")
-        data = BackendClient.get_assessments(lang_code=lang_code)
+        data = await BackendClient.get_assessments(client, lang_code=lang_code)
 
         assessments = tuple(
             Assessment(
@@ -145,15 +191,18 @@ class BotDataLoader:
         return assessment_for_age_range_id
 
     @classmethod
-    def _get_day_and_time_slots(cls) -> tuple[DayAndTimeSlot, ...]:
+    async def _get_day_and_time_slots(
+        cls, client: httpx.AsyncClient
+    ) -> tuple[DayAndTimeSlot, ...]:
         """Gets day and time slots from the backend."""
 
         def get_hour(str_: str) -> int:
             """Takes a string like 05:00:00 and returns hours (5 in this example)."""
-            return int(str_.split(":")[0])
+            # the backend serializes time in ISO 8601 format, so hours always take two digits
+            return int(str_[:2])
 
         logger.info("Loading day and time slots")
-        data = BackendClient.get_day_and_time_slots()
+        data = await BackendClient.get_day_and_time_slots(client)
 
         return tuple(
             DayAndTimeSlot(
@@ -166,11 +215,13 @@ class BotDataLoader:
         )
 
     @classmethod
-    def _get_languages_and_levels(cls) -> tuple[LanguageAndLevel, ...]:
+    async def _get_languages_and_levels(
+        cls, client: httpx.AsyncClient
+    ) -> tuple[LanguageAndLevel, ...]:
         """Gets languages and levels from the backend."""
 
         logger.info("Loading languages and levels")
-        data = BackendClient.get_languages_and_levels()
+        data = await BackendClient.get_languages_and_levels(client)
 
         return tuple(
             LanguageAndLevel(
@@ -179,6 +230,183 @@ class BotDataLoader:
             for item in data
         )
 
+    @classmethod
+    def _make_static_keyboards(
+        cls,
+        bot_data: BotData,
+        phrases: dict[str, MultilingualBotPhrase],
+        age_ranges_for_type: dict[AgeRangeType, tuple[AgeRange, ...]],
+    ) -> None:
+        """Creates buttons and keyboards that only depend on locale (and maybe role) once,
+        so that they don't have to be recreated every time the user is asked the respective
+        question.
+        """
+
+        bot_data.keyboard_share_phone_for_locale = {
+            locale: ReplyKeyboardMarkup(
+                [[KeyboardButton(text=phrases["share_phone"][locale], request_contact=True)]],
+                one_time_keyboard=True,
+            )
+            for locale in LOCALES
+        }
+
+        bot_data.keyboard_start_assessment_for_locale = {
+            locale: InlineKeyboardMarkup(
+                [
+                    [
+                        InlineKeyboardButton(
+                            text=phrases["assessment_option_start"][locale],
+                            callback_data=CommonCallbackData.OK,
+                        )
+                    ]
+                ]
+            )
+            for locale in LOCALES
+        }
+
+        # each button in its own row
+        bot_data.keyboard_store_username_for_locale = {
+            locale: InlineKeyboardMarkup(
+                [
+                    [
+                        InlineKeyboardButton(
+                            text=phrases[f"username_reply_{option}"][locale],
+                            callback_data=f"store_username_{option}",
+                        )
+                    ]
+                    for option in (CommonCallbackData.YES, CommonCallbackData.NO)
+                ]
+            )
+            for locale in LOCALES
+        }
+
+        bot_data.keyboard_yes_no_for_locale = {
+            locale: InlineKeyboardMarkup([buttons])
+            for locale, buttons in cls._make_buttons_for_each_locale(
+                phrases,
+                {
+                    option: f"option_{option}"
+                    for option in (CommonCallbackData.YES, CommonCallbackData.NO)
+                },
+            ).items()
+        }
+
+        # each button in a separate row to put them into one single column
+        bot_data.keyboard_review_reaction_for_locale = {
+            locale: InlineKeyboardMarkup([[button] for button in buttons])
+            for locale, buttons in cls._make_buttons_for_each_locale(
+                phrases, {option: f"review_reaction_{option}" for option in ("yes", "no")}
+            ).items()
+        }
+
+        # student or coordinator cannot choose "L2 only" because that wouldn't make sense
+        bot_data.buttons_class_communication_language_for_locale_and_role = {
+            (locale, role): buttons
+            for role in (Role.STUDENT, Role.TEACHER, Role.COORDINATOR)
+            for locale, buttons in cls._make_buttons_for_each_locale(
+                phrases,
+                {
+                    code: f"class_communication_language_option_{code}"
+                    for code in STUDENT_COMMUNICATION_LANGUAGE_CODES
+                    if role == Role.TEACHER or code != "l2_only"
+                },
+            ).items()
+        }
+
+        bot_data.buttons_disclaimer_for_locale = cls._make_buttons_for_each_locale(
+            phrases,
+            {
+                option: f"disclaimer_option_{option}"
+                for option in (CommonCallbackData.OK, CommonCallbackData.ABORT)
+            },
+        )
+
+        bot_data.buttons_how_long_been_learning_english_for_locale = (
+            cls._make_buttons_for_each_locale(
+                phrases, {name: f"option_{name}" for name in ("less_than_year", "year_or_more")}
+            )
+        )
+
+        bot_data.buttons_non_teaching_help_for_locale = cls._make_buttons_for_each_locale(
+            phrases,
+            {option: f"option_non_teaching_help_{option}" for option in NON_TEACHING_HELP_TYPES},
+        )
+
+        bot_data.buttons_number_of_groups_for_locale = cls._make_buttons_for_each_locale(
+            phrases, {number: f"option_number_of_groups_{number}" for number in (1, 2)}
+        )
+
+        bot_data.buttons_role_for_locale = cls._make_buttons_for_each_locale(
+            phrases,
+            {role: f"option_{role}" for role in (Role.STUDENT, Role.TEACHER, Role.COORDINATOR)},
+        )
+
+        bot_data.buttons_teacher_peer_help_for_locale = cls._make_buttons_for_each_locale(
+            phrases,
+            {option: f"option_teacher_peer_help_{option}" for option in TEACHER_PEER_HELP_TYPES},
+        )
+
+        # buttons keep the order in which the backend returned the age ranges
+        bot_data.buttons_teacher_student_age_range_for_locale = cls._make_buttons_for_each_locale(
+            phrases,
+            {
+                age_range.id: age_range.bot_phrase_id
+                for age_range in age_ranges_for_type[AgeRangeType.TEACHER]
+                # always true: `_get_age_ranges()` assigns phrase IDs to all teachers' age ranges
+                if age_range.bot_phrase_id is not None
+            },
+        )
+
+        bot_data.buttons_teaching_mode_for_locale = cls._make_buttons_for_each_locale(
+            phrases,
+            {option: f"option_teach_{option}" for option in ("group", "speaking_club", "both")},
+        )
+
+        bot_data.buttons_review_category_for_locale_role_and_phone = {
+            (locale, role, has_phone_number): buttons
+            for role in (Role.STUDENT, Role.TEACHER, Role.COORDINATOR)
+            for has_phone_number in (False, True)
+            for locale, buttons in cls._make_buttons_for_each_locale(
+                phrases,
+                {
+                    category: f"review_option_{category}"
+                    for category in get_review_categories(role, has_phone_number)
+                },
+            ).items()
+        }
+
+    @staticmethod
+    def _make_greeting_template(phrases: dict[str, MultilingualBotPhrase]) -> str:
+        """Return greeting in all locales, with ``{name}`` to be replaced with user's first name.
+
+        Braces in the phrases themselves are escaped to make ``str.format()`` safe to use.
+        """
+
+        def escape(text: str) -> str:
+            return text.replace("{", "{{").replace("}", "}}")
+
+        return "".join(
+            f"{escape(phrases['hello'][locale])} {{name}}! "
+            f"{escape(phrases['choose_language_of_conversation'][locale])}\n\n"
+            for locale in LOCALES
+        )
+
+    @staticmethod
+    def _make_buttons_for_each_locale(
+        phrases: dict[str, MultilingualBotPhrase],
+        phrase_id_for_callback_data: dict[str | int, str],
+    ) -> dict[Locale, tuple[InlineKeyboardButton, ...]]:
+        """Matches each locale to a tuple of buttons with given callback data
+        and localized texts (with given IDs of bot phrases).
+        """
+        return {
+            locale: tuple(
+                InlineKeyboardButton(text=phrases[phrase_id][locale], callback_data=callback_data)
+                for callback_data, phrase_id in phrase_id_for_callback_data.items()
+            )
+            for locale in LOCALES
+        }
+
     @staticmethod
     def _load_phrases() -> dict[str, MultilingualBotPhrase]:
         """Reads bot phrases from CSV file, returns dictionary with internal IDs as key,
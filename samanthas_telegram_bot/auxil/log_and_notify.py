@@ -11,6 +11,23 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+_NUMERIC_LEVEL_FOR_LEVEL = {
+    LoggingLevel.DEBUG: logging.DEBUG,
+    LoggingLevel.INFO: logging.INFO,
+    LoggingLevel.WARNING: logging.WARNING,
+    LoggingLevel.ERROR: logging.ERROR,
+    LoggingLevel.CRITICAL: logging.CRITICAL,
+    LoggingLevel.EXCEPTION: logging.ERROR,
+}
+
+
+def is_logging_enabled_for(level: LoggingLevel) -> bool:
+    """Returns ``True`` if a message with this level would be logged.
+
+    Useful for not composing an expensive log message that would be discarded anyway.
+    """
+    return logger.isEnabledFor(_NUMERIC_LEVEL_FOR_LEVEL[level])
+
 
 async def logs(
     bot: Bot,
@@ -27,6 +44,11 @@ async def logs(
 
     By default, shows calling function's name (due to default stack level).
     """
+    # Nothing to do if the message would be discarded by the logger anyway:
+    # don't spend time on composing the text.
+    if not needs_to_notify_admin_group and not is_logging_enabled_for(level):
+        return
+
     extra_info = ""
 
     if isinstance(update, Update):
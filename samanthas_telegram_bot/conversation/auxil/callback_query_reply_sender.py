@@ -1,29 +1,77 @@
-from datetime import timedelta
+import functools
+from datetime import datetime, timedelta
 
 from telegram import CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.constants import ParseMode
 
 from samanthas_telegram_bot.auxil.log_and_notify import logs
-from samanthas_telegram_bot.conversation.auxil.enums import (
-    CommonCallbackData,
-    UserDataReviewCategory,
-)
+from samanthas_telegram_bot.conversation.auxil.constants import EMPTY_INLINE_KEYBOARD
+from samanthas_telegram_bot.conversation.auxil.enums import CommonCallbackData
 from samanthas_telegram_bot.conversation.auxil.helpers import (
-    make_buttons_yes_no,
     make_dict_for_message_to_ask_age_student,
     make_dict_for_message_with_inline_keyboard,
+    make_dict_for_message_yes_no,
 )
 from samanthas_telegram_bot.data_structures.constants import (
-    NON_TEACHING_HELP_TYPES,
-    STUDENT_COMMUNICATION_LANGUAGE_CODES,
-    TEACHER_PEER_HELP_TYPES,
+    TEACHER_PEER_HELP_BIT_FOR_TYPE,
+    UTC_OFFSETS_FOR_TIMEZONE_BUTTONS,
 )
 from samanthas_telegram_bot.data_structures.context_types import CUSTOM_CONTEXT_TYPES
-from samanthas_telegram_bot.data_structures.enums import AgeRangeType, LoggingLevel, Role
+from samanthas_telegram_bot.data_structures.enums import LoggingLevel, Role
 from samanthas_telegram_bot.data_structures.literal_types import Locale
 from samanthas_telegram_bot.data_structures.models import AssessmentQuestion
 
 
+def _make_timezone_button_layout() -> tuple[tuple[tuple[timedelta, str, str], ...], ...]:
+    """Returns rows of (UTC offset, offset label, callback data) for timezone buttons.
+
+    Only the local time shown on a button depends on the time of the message,
+    so everything else is computed once.
+    """
+
+    def make_offset_label(hour: int, minute: int) -> str:
+        label = "0" if hour == 0 else f"{hour:+d}"
+        if minute:
+            label += f":{minute}"
+        return label
+
+    return tuple(
+        tuple(
+            (
+                timedelta(hours=hour, minutes=minute),
+                make_offset_label(hour, minute),
+                f"{hour}:{minute:02d}",
+            )
+            for hour, minute in offsets_in_row
+        )
+        for offsets_in_row in UTC_OFFSETS_FOR_TIMEZONE_BUTTONS
+    )
+
+
+_TIMEZONE_BUTTON_LAYOUT = _make_timezone_button_layout()
+
+
+@functools.lru_cache(maxsize=128)
+def _make_timezone_keyboard(utc_time: datetime) -> InlineKeyboardMarkup:
+    """Returns keyboard with local times for each timezone button.
+
+    The buttons only show hours and minutes, so ``utc_time`` is expected to be rounded down
+    to the minute: all users asked within the same minute then get the same (immutable) keyboard.
+    """
+    return InlineKeyboardMarkup(
+        [
+            [
+                InlineKeyboardButton(
+                    text=f"{(utc_time + delta).strftime('%H:%M')} ({offset_label})",
+                    callback_data=callback_data,
+                )
+                for delta, offset_label, callback_data in row
+            ]
+            for row in _TIMEZONE_BUTTON_LAYOUT
+        ]
+    )
+
+
 class CallbackQueryReplySender:
     """A helper class that sends replies to user by executing
     `telegram.CallbackQuery.edit_message_text()`.
@@ -48,32 +96,19 @@ class CallbackQueryReplySender:
         a student; Russian, Ukrainian, any of those two or L2 only for a teacher).
         """
 
-        locale: Locale = context.user_data.locale
-
-        if context.user_data.role == Role.TEACHER:
-            language_codes = STUDENT_COMMUNICATION_LANGUAGE_CODES[:]
-        else:
-            # student or coordinator cannot choose "L2 only" because that wouldn't make sense
-            language_codes = tuple(
-                c for c in STUDENT_COMMUNICATION_LANGUAGE_CODES if c != "l2_only"
-            )
-
-        language_for_callback_data = {
-            code: context.bot_data.phrases[f"class_communication_language_option_{code}"][locale]
-            for code in language_codes
-        }
+        bot_data = context.bot_data
+        user_data = context.user_data
+        locale: Locale = user_data.locale
+        phrases = bot_data.phrases_for_locale[locale]
+        role = user_data.role
 
-        language_buttons = [
-            InlineKeyboardButton(text=value, callback_data=key)
-            for key, value in language_for_callback_data.items()
+        language_buttons = bot_data.buttons_class_communication_language_for_locale_and_role[
+            (locale, role)
         ]
-        role = context.user_data.role
 
         await query.edit_message_text(
             **make_dict_for_message_with_inline_keyboard(
-                message_text=context.bot_data.phrases[f"ask_class_communication_language_{role}"][
-                    locale
-                ],
+                message_text=phrases[f"ask_class_communication_language_{role}"],
                 buttons=language_buttons,
                 buttons_per_row=1,
             )
@@ -88,9 +123,10 @@ class CallbackQueryReplySender:
         """Ask first name."""
 
         locale: Locale = context.user_data.locale
+        phrases = context.bot_data.phrases_for_locale[locale]
         await query.edit_message_text(
-            context.bot_data.phrases["ask_first_name"][locale],
-            reply_markup=InlineKeyboardMarkup([]),
+            phrases["ask_first_name"],
+            reply_markup=EMPTY_INLINE_KEYBOARD,
         )
 
     @classmethod
@@ -101,21 +137,12 @@ class CallbackQueryReplySender:
     ) -> None:
         """Asks a student how long they have been learning English."""
         locale: Locale = context.user_data.locale
-
-        buttons = [
-            InlineKeyboardButton(
-                text=context.bot_data.phrases[f"option_{name}"][locale],
-                callback_data=name,
-            )
-            for name in ("less_than_year", "year_or_more")
-        ]
+        phrases = context.bot_data.phrases_for_locale[locale]
 
         await query.edit_message_text(
             **make_dict_for_message_with_inline_keyboard(
-                message_text=context.bot_data.phrases[
-                    "ask_student_how_long_been_learning_english"
-                ][locale],
-                buttons=buttons,
+                message_text=phrases["ask_student_how_long_been_learning_english"],
+                buttons=context.bot_data.buttons_how_long_been_learning_english_for_locale[locale],
                 buttons_per_row=2,
             )
         )
@@ -129,36 +156,36 @@ class CallbackQueryReplySender:
     ) -> None:
         """Asks a user to choose language level(s)."""
 
-        locale: Locale = context.user_data.locale
+        bot_data = context.bot_data
+        user_data = context.user_data
+        locale: Locale = user_data.locale
+        phrases = bot_data.phrases_for_locale[locale]
 
         # if the user has already chosen one level, add "Next" button
         done_button = None
 
         if show_done_button:
             done_button = InlineKeyboardButton(
-                text=context.bot_data.phrases["ask_teaching_language_level_done"][locale],
+                text=phrases["ask_teaching_language_level_done"],
                 callback_data=CommonCallbackData.NEXT,
             )
 
-        last_language_added = tuple(context.user_data.levels_for_teaching_language.keys())[-1]
-        language_name = context.bot_data.phrases[last_language_added][locale]
+        # dictionaries keep insertion order, so the last key is the language added last
+        last_language_added = next(reversed(user_data.levels_for_teaching_language))
+        language_name = phrases[last_language_added]
 
-        text = (
-            f"{context.bot_data.phrases[f'ask_language_level_{context.user_data.role}'][locale]} "
-            f"{language_name}?"
-        )
+        text = f"{phrases[f'ask_language_level_{user_data.role}']} {language_name}?"
 
         # different languages have different set of levels they can be taught at
         relevant_levels = (
             item.level
-            for item in context.bot_data.language_and_level_objects_for_language_id[
-                last_language_added
-            ]
+            for item in bot_data.language_and_level_objects_for_language_id[last_language_added]
         )
+        chosen_levels = frozenset(user_data.levels_for_teaching_language[last_language_added])
         level_buttons = [
             InlineKeyboardButton(text=level, callback_data=level)
             for level in relevant_levels
-            if level not in context.user_data.levels_for_teaching_language[last_language_added]
+            if level not in chosen_levels
         ]
 
         await query.edit_message_text(
@@ -177,16 +204,18 @@ class CallbackQueryReplySender:
         query: CallbackQuery,
     ) -> None:
         """Asks user the next assessment question."""
-        questions = context.chat_data.assessment.questions
-        index = context.chat_data.current_assessment_question_index
+        chat_data = context.chat_data
+        questions = chat_data.assessment.questions
+        index = chat_data.current_assessment_question_index
         current_question: AssessmentQuestion = questions[index]
+        number_of_questions = len(questions)
 
         await logs(
             bot=context.bot,
             level=LoggingLevel.DEBUG,
             text=(
                 f"Preparing to ask question #{index + 1}"
-                f" of {len(context.chat_data.assessment.questions)}, QID {current_question.id}"
+                f" of {number_of_questions}, QID {current_question.id}"
             ),
         )
 
@@ -195,22 +224,22 @@ class CallbackQueryReplySender:
             for option in current_question.options
         ]
         locale: Locale = context.user_data.locale
+        phrases = context.bot_data.phrases_for_locale[locale]
         abort_button = InlineKeyboardButton(
-            text=context.bot_data.phrases["assessment_option_abort"][locale],
+            text=phrases["assessment_option_abort"],
             callback_data=CommonCallbackData.ABORT,
         )
 
         await query.edit_message_text(
             **make_dict_for_message_with_inline_keyboard(
                 message_text=(
-                    f"Question {index + 1} out of "
-                    f"{len(context.chat_data.assessment.questions)}\n\n"
+                    f"Question {index + 1} out of {number_of_questions}\n\n"
                     f"{current_question.text}"
                 ),
                 buttons=buttons,
                 buttons_per_row=2,
                 bottom_row_button=(
-                    abort_button if context.chat_data.assessment_dont_knows_in_a_row >= 5 else None
+                    abort_button if chat_data.assessment_dont_knows_in_a_row >= 5 else None
                 ),
             )
         )
@@ -226,33 +255,32 @@ class CallbackQueryReplySender:
         If this is a student, asks them what help they need.
         If this is a teacher, asks them what help they can provide.
         """
-        locale: Locale = context.user_data.locale
+        bot_data = context.bot_data
+        user_data = context.user_data
+        locale: Locale = user_data.locale
+        phrases = bot_data.phrases_for_locale[locale]
 
         # These options match IDs in data migration in django_webapps.  We can leave it like this
         # for now, because bot phrases have to be stored in bot anyway, which means the names
         # also need to be controlled manually even if the types of non-teaching help are received
         # from the back-end.  To completely eliminate the need for manual editing in two places,
         # the bot should receive the bot phrases from there too.
+        selected_help_types = frozenset(user_data.non_teaching_help_types)
         buttons = [
-            InlineKeyboardButton(
-                text=context.bot_data.phrases[f"option_non_teaching_help_{option}"][locale],
-                callback_data=option,
-            )
-            for option in NON_TEACHING_HELP_TYPES
-            if option not in context.user_data.non_teaching_help_types
+            button
+            for button in bot_data.buttons_non_teaching_help_for_locale[locale]
+            if button.callback_data not in selected_help_types
         ]
 
         # "Done" button must be there right from the start because the teacher may not be willing
         # to provide any kind help or a student may not need any help
         await query.edit_message_text(
             **make_dict_for_message_with_inline_keyboard(
-                message_text=context.bot_data.phrases[
-                    f"ask_non_teaching_help_{context.user_data.role}"
-                ][locale],
+                message_text=phrases[f"ask_non_teaching_help_{user_data.role}"],
                 buttons=buttons,
                 buttons_per_row=1,
                 bottom_row_button=InlineKeyboardButton(
-                    text=context.bot_data.phrases["option_non_teaching_help_done"][locale],
+                    text=phrases["option_non_teaching_help_done"],
                     callback_data=CommonCallbackData.DONE,
                 ),
             )
@@ -266,47 +294,18 @@ class CallbackQueryReplySender:
     ) -> None:
         """Asks what info the user wants to change during the review."""
 
+        bot_data = context.bot_data
         user_data = context.user_data
         locale: Locale = user_data.locale
+        phrases = bot_data.phrases_for_locale[locale]
 
-        options = [
-            # Without f-strings they will produce something like <Enum: "name">.
-            # An alternative is to use .value attribute.
-            f"{UserDataReviewCategory.FIRST_NAME}",
-            f"{UserDataReviewCategory.LAST_NAME}",
-            f"{UserDataReviewCategory.EMAIL}",
-            f"{UserDataReviewCategory.CLASS_COMMUNICATION_LANGUAGE}",
-            f"{UserDataReviewCategory.TIMEZONE}",
-        ]
-
-        if user_data.role != Role.COORDINATOR:
-            options += [
-                f"{UserDataReviewCategory.DAY_AND_TIME_SLOTS}",
-            ]
-
-        if user_data.phone_number:
-            options.append(f"{UserDataReviewCategory.PHONE_NUMBER}")
-
-        if user_data.role == Role.STUDENT:
-            options.append(f"{UserDataReviewCategory.STUDENT_AGE_GROUPS}")
-
-        # Because of complex logic around English, we will not offer the student to review their
-        # language/level for now.  This option will be reserved for teachers.
-        if user_data.role == Role.TEACHER:
-            options.append(f"{UserDataReviewCategory.LANGUAGES_AND_LEVELS}")
-            # TODO review preferred students' ages?
-
-        buttons = [
-            InlineKeyboardButton(
-                text=context.bot_data.phrases[f"review_option_{option}"][locale],
-                callback_data=option,
-            )
-            for option in options
+        buttons = bot_data.buttons_review_category_for_locale_role_and_phone[
+            (locale, user_data.role, bool(user_data.phone_number))
         ]
 
         await query.edit_message_text(
             **make_dict_for_message_with_inline_keyboard(
-                message_text=context.bot_data.phrases["review_ask_category"][locale],
+                message_text=phrases["review_ask_category"],
                 buttons=buttons,
                 buttons_per_row=1,
             )
@@ -320,19 +319,12 @@ class CallbackQueryReplySender:
     ) -> None:
         """Ask role (student, teacher or coordinator)."""
         locale: Locale = context.user_data.locale
-
-        buttons = [
-            InlineKeyboardButton(
-                text=context.bot_data.phrases[f"option_{role}"][locale],
-                callback_data=role,
-            )
-            for role in (Role.STUDENT, Role.TEACHER, Role.COORDINATOR)
-        ]
+        phrases = context.bot_data.phrases_for_locale[locale]
 
         await query.edit_message_text(
             **make_dict_for_message_with_inline_keyboard(
-                message_text=context.bot_data.phrases["ask_role"][locale],
-                buttons=buttons,
+                message_text=phrases["ask_role"],
+                buttons=context.bot_data.buttons_role_for_locale[locale],
                 buttons_per_row=1,
             )
         )
@@ -344,19 +336,11 @@ class CallbackQueryReplySender:
         query: CallbackQuery,
     ) -> None:
         locale: Locale = context.user_data.locale
+        phrases = context.bot_data.phrases_for_locale[locale]
 
         await query.edit_message_text(
-            context.bot_data.phrases["ask_student_start_assessment"][locale],
-            reply_markup=InlineKeyboardMarkup(
-                [
-                    [
-                        InlineKeyboardButton(
-                            text=context.bot_data.phrases["assessment_option_start"][locale],
-                            callback_data=CommonCallbackData.OK,
-                        )
-                    ]
-                ]
-            ),
+            phrases["ask_student_start_assessment"],
+            reply_markup=context.bot_data.keyboard_start_assessment_for_locale[locale],
             parse_mode=ParseMode.HTML,
         )
 
@@ -379,11 +363,12 @@ class CallbackQueryReplySender:
 
         user_data = context.user_data
         locale: Locale = user_data.locale
+        phrases = context.bot_data.phrases_for_locale[locale]
         role: Role = user_data.role
 
         await query.edit_message_text(
-            context.bot_data.phrases[f"ask_{role}_any_additional_help"][locale],
-            reply_markup=InlineKeyboardMarkup([]),
+            phrases[f"ask_{role}_any_additional_help"],
+            reply_markup=EMPTY_INLINE_KEYBOARD,
         )
 
     @classmethod
@@ -393,35 +378,31 @@ class CallbackQueryReplySender:
         query: CallbackQuery,
     ) -> None:
         """Asks a teacher to choose age groups of students."""
-        locale: Locale = context.user_data.locale
-
-        all_buttons = [
-            InlineKeyboardButton(
-                text=context.bot_data.phrases[age_range.bot_phrase_id][locale],
-                callback_data=age_range.id,
-            )
-            for age_range in context.bot_data.age_ranges_for_type[AgeRangeType.TEACHER]
-        ]
+        bot_data = context.bot_data
+        user_data = context.user_data
+        locale: Locale = user_data.locale
+        phrases = bot_data.phrases_for_locale[locale]
 
+        selected_age_range_ids = frozenset(user_data.teacher_student_age_range_ids)
         buttons_to_show = [
-            b
-            for b in all_buttons
-            if b.callback_data not in context.user_data.teacher_student_age_range_ids
+            button
+            for button in bot_data.buttons_teacher_student_age_range_for_locale[locale]
+            if button.callback_data not in selected_age_range_ids
         ]
 
         # only show "Done" button if the user has selected something on the previous step
         done_button = (
             None
-            if buttons_to_show == all_buttons
+            if not selected_age_range_ids
             else InlineKeyboardButton(
-                text=context.bot_data.phrases["ask_teacher_student_age_groups_done"][locale],
+                text=phrases["ask_teacher_student_age_groups_done"],
                 callback_data=CommonCallbackData.DONE,
             )
         )
 
         await query.edit_message_text(
             **make_dict_for_message_with_inline_keyboard(
-                message_text=context.bot_data.phrases["ask_teacher_student_age_groups"][locale],
+                message_text=phrases["ask_teacher_student_age_groups"],
                 buttons=buttons_to_show,
                 buttons_per_row=1,
                 bottom_row_button=done_button,
@@ -437,23 +418,12 @@ class CallbackQueryReplySender:
         """Asks adult teacher whether can teach regular groups and/or host speaking clubs."""
         # It is possible that an adult teacher only joins the project to host speaking clubs
         locale: Locale = context.user_data.locale
-
-        buttons = [
-            InlineKeyboardButton(
-                text=context.bot_data.phrases[f"option_teach_{option}"][locale],
-                callback_data=option,
-            )
-            for option in (
-                "group",
-                "speaking_club",
-                "both",
-            )
-        ]
+        phrases = context.bot_data.phrases_for_locale[locale]
 
         await query.edit_message_text(
             **make_dict_for_message_with_inline_keyboard(
-                message_text=context.bot_data.phrases["ask_teacher_group_speaking_club"][locale],
-                buttons=buttons,
+                message_text=phrases["ask_teacher_group_speaking_club"],
+                buttons=context.bot_data.buttons_teaching_mode_for_locale[locale],
                 buttons_per_row=1,
             )
         )
@@ -467,32 +437,28 @@ class CallbackQueryReplySender:
         """Asks young teacher whether they are over 16 and ready to host speaking clubs."""
         # This is intended for teachers that are under 18 years old and hence can't teach in
         # regular groups.  The check is done in main.py.
+        bot_data = context.bot_data
         locale: Locale = context.user_data.locale
+        phrases = bot_data.phrases_for_locale[locale]
 
         buttons = [
             InlineKeyboardButton(
-                text=context.bot_data.phrases["option_young_teacher_under_16"][locale],
+                text=phrases["option_young_teacher_under_16"],
                 callback_data=CommonCallbackData.NO,
             ),
             InlineKeyboardButton(
-                text=context.bot_data.phrases["option_young_teacher_over_16_but_no_speaking_club"][
-                    locale
-                ],
+                text=phrases["option_young_teacher_over_16_but_no_speaking_club"],
                 callback_data=CommonCallbackData.NO,
             ),
             InlineKeyboardButton(
-                text=context.bot_data.phrases[
-                    "option_young_teacher_over_16_and_ready_for_speaking_club"
-                ][locale],
+                text=phrases["option_young_teacher_over_16_and_ready_for_speaking_club"],
                 callback_data=CommonCallbackData.YES,
             ),
         ]
 
         await query.edit_message_text(
             **make_dict_for_message_with_inline_keyboard(
-                message_text=context.bot_data.phrases[
-                    "ask_if_over_16_and_can_host_speaking_clubs"
-                ][locale],
+                message_text=phrases["ask_if_over_16_and_can_host_speaking_clubs"],
                 buttons=buttons,
                 buttons_per_row=1,
             )
@@ -506,18 +472,12 @@ class CallbackQueryReplySender:
     ) -> None:
         """Asks a teacher how many groups they want to take."""
         locale: Locale = context.user_data.locale
-        buttons = [
-            InlineKeyboardButton(
-                context.bot_data.phrases[f"option_number_of_groups_{number}"][locale],
-                callback_data=number,
-            )
-            for number in (1, 2)
-        ]
+        phrases = context.bot_data.phrases_for_locale[locale]
 
         await query.edit_message_text(
             **make_dict_for_message_with_inline_keyboard(
-                message_text=context.bot_data.phrases["ask_teacher_number_of_groups"][locale],
-                buttons=buttons,
+                message_text=phrases["ask_teacher_number_of_groups"],
+                buttons=context.bot_data.buttons_number_of_groups_for_locale[locale],
                 buttons_per_row=1,
             )
         )
@@ -530,26 +490,26 @@ class CallbackQueryReplySender:
     ) -> None:
         """Asks a teacher whether they are able to help their fellow teachers."""
         # this question is only asked if teacher is experienced, but the check is done in main.py
+        bot_data = context.bot_data
         locale: Locale = context.user_data.locale
+        phrases = bot_data.phrases_for_locale[locale]
+        selected_types_mask = context.chat_data.selected_peer_help_types_mask
 
         buttons = [
-            InlineKeyboardButton(
-                text=context.bot_data.phrases[f"option_teacher_peer_help_{option}"][locale],
-                callback_data=option,
-            )
-            for option in TEACHER_PEER_HELP_TYPES
-            if option not in context.chat_data.peer_help_callback_data
+            button
+            for button in bot_data.buttons_teacher_peer_help_for_locale[locale]
+            if not selected_types_mask & TEACHER_PEER_HELP_BIT_FOR_TYPE[button.callback_data]
         ]
 
         # "Done" button must be there right from the start because the teacher may not be willing
         # to provide any kind of peer help
         await query.edit_message_text(
             **make_dict_for_message_with_inline_keyboard(
-                message_text=context.bot_data.phrases["ask_teacher_peer_help"][locale],
+                message_text=phrases["ask_teacher_peer_help"],
                 buttons=buttons,
                 buttons_per_row=1,
                 bottom_row_button=InlineKeyboardButton(
-                    context.bot_data.phrases["ask_teacher_peer_help_done"][locale],
+                    phrases["ask_teacher_peer_help_done"],
                     callback_data=CommonCallbackData.DONE,
                 ),
             )
@@ -564,32 +524,29 @@ class CallbackQueryReplySender:
     ) -> None:
         """Asks a user for them to choose languages to learn/teach."""
 
-        locale: Locale = context.user_data.locale
+        bot_data = context.bot_data
+        user_data = context.user_data
+        locale: Locale = user_data.locale
+        phrases = bot_data.phrases_for_locale[locale]
 
-        language_for_callback_data = {
-            code: context.bot_data.phrases[code][locale]
-            for code in context.bot_data.sorted_language_ids
-            if code not in context.user_data.levels_for_teaching_language
-        }
+        chosen_languages = user_data.levels_for_teaching_language
+        language_buttons = [
+            InlineKeyboardButton(text=phrases[code], callback_data=code)
+            for code in bot_data.sorted_language_ids
+            if code not in chosen_languages
+        ]
 
         # if the user has already chosen one language, add "Done" button
         done_button = None
         if show_done_button:
             done_button = InlineKeyboardButton(
-                text=context.bot_data.phrases["ask_teaching_language_done"][locale],
+                text=phrases["ask_teaching_language_done"],
                 callback_data=CommonCallbackData.DONE,
             )
 
-        language_buttons = [
-            InlineKeyboardButton(text=value, callback_data=key)
-            for key, value in language_for_callback_data.items()
-        ]
-
         await query.edit_message_text(
             **make_dict_for_message_with_inline_keyboard(
-                message_text=context.bot_data.phrases[
-                    f"ask_teaching_language_{context.user_data.role}"
-                ][locale],
+                message_text=phrases[f"ask_teaching_language_{user_data.role}"],
                 buttons=language_buttons,
                 buttons_per_row=2,
                 bottom_row_button=done_button,
@@ -608,36 +565,35 @@ class CallbackQueryReplySender:
         bot_data = context.bot_data
         user_data = context.user_data
         locale: Locale = user_data.locale
+        phrases = bot_data.phrases_for_locale[locale]
 
         day_index = context.chat_data.day_index
+        selected_slot_ids = frozenset(user_data.day_and_time_slot_ids)
 
         offset_hour = user_data.utc_offset_hour
-        offset_minute = str(user_data.utc_offset_minute).zfill(2)  # to produce "00" from 0
+        offset_minute = user_data.utc_offset_minute
 
-        # % 24 is needed to avoid showing 22:00-25:00 to the user
         buttons = [
             InlineKeyboardButton(
-                f"{(slot.from_utc_hour + offset_hour) % 24}:{offset_minute}-"
-                f"{(slot.to_utc_hour + offset_hour) % 24}:{offset_minute}",
+                slot.label_for_utc_offset(offset_hour, offset_minute),
                 callback_data=slot.id,
             )
             for slot in bot_data.day_and_time_slots_for_day_index[day_index]
             # exclude slots that user already selected
-            if slot.id not in user_data.day_and_time_slot_ids
+            if slot.id not in selected_slot_ids
         ]
 
-        phrases = bot_data.phrases
         message_text = (
-            phrases["ask_timeslots"][locale]
+            phrases["ask_timeslots"]
             + " <strong>"
-            + (phrases["ask_slots_" + str(day_index)][locale])
+            + (phrases["ask_slots_" + str(day_index)])
             + r"</strong>? ✎"
         )
 
         # The message explaining how multiselect works is pretty long,
         # so better to only show it once, at the beginning
         if day_index == 0:
-            message_text += f"\n\n{phrases['note_multiselect'][locale]}"
+            message_text += f"\n\n{phrases['note_multiselect']}"
 
         await query.edit_message_text(
             **make_dict_for_message_with_inline_keyboard(
@@ -645,7 +601,7 @@ class CallbackQueryReplySender:
                 buttons=buttons,
                 buttons_per_row=3,
                 bottom_row_button=InlineKeyboardButton(
-                    text=phrases["ask_slots_next"][locale],
+                    text=phrases["ask_slots_next"],
                     callback_data=CommonCallbackData.NEXT,
                 ),
                 parse_mode=ParseMode.HTML,
@@ -661,77 +617,12 @@ class CallbackQueryReplySender:
         """Asks timezone."""
 
         locale: Locale = context.user_data.locale
-        utc_time = query.message.date
+        phrases = context.bot_data.phrases_for_locale[locale]
+        utc_time = query.message.date.replace(second=0, microsecond=0)
 
         await query.edit_message_text(
-            context.bot_data.phrases["ask_timezone"][locale],
-            reply_markup=InlineKeyboardMarkup(
-                [
-                    [
-                        InlineKeyboardButton(
-                            text=f"{(utc_time + timedelta(hours=dlt)).strftime('%H:%M')} ({dlt})",
-                            callback_data=f"{dlt}:00",
-                        )
-                        for dlt in (-8, -7, -6)
-                    ],
-                    [
-                        InlineKeyboardButton(
-                            text=f"{(utc_time + timedelta(hours=dlt)).strftime('%H:%M')} ({dlt})",
-                            callback_data=f"{dlt}:00",
-                        )
-                        for dlt in (-5, -4, -3)
-                    ],
-                    [
-                        InlineKeyboardButton(
-                            text=f"{(utc_time + timedelta(hours=-1)).strftime('%H:%M')} (-1)",
-                            callback_data="-1:00",
-                        ),
-                        InlineKeyboardButton(
-                            text=f"{utc_time.strftime('%H:%M')} (0)",
-                            callback_data="0:00",
-                        ),
-                        InlineKeyboardButton(
-                            text=f"{(utc_time + timedelta(hours=1)).strftime('%H:%M')} (+1)",
-                            callback_data="1:00",
-                        ),
-                    ],
-                    [
-                        InlineKeyboardButton(
-                            text=f"{(utc_time + timedelta(hours=dlt)).strftime('%H:%M')} "
-                            f"(+{dlt})",
-                            callback_data=f"{dlt}:00",
-                        )
-                        for dlt in (2, 3, 4)
-                    ],
-                    [
-                        InlineKeyboardButton(
-                            text=f"{(utc_time + timedelta(hours=5, minutes=30)).strftime('%H:%M')}"
-                            f" (+5:30)",
-                            callback_data="5:30",
-                        ),
-                        InlineKeyboardButton(
-                            text=f"{(utc_time + timedelta(hours=7)).strftime('%H:%M')} (+7)",
-                            callback_data="7:00",
-                        ),
-                    ],
-                    [
-                        InlineKeyboardButton(
-                            text=f"{(utc_time + timedelta(hours=dlt)).strftime('%H:%M')} "
-                            f"(+{dlt})",
-                            callback_data=f"{dlt}:00",
-                        )
-                        for dlt in (8, 9, 10)
-                    ],
-                    [
-                        InlineKeyboardButton(
-                            text=f"{(utc_time + timedelta(hours=dlt)).strftime('%H:%M')} "
-                            f"(+{dlt})",
-                            callback_data=f"{dlt}:00",
-                        )
-                        for dlt in (11, 12, 13)
-                    ],
-                ]
-            ),
+            phrases["ask_timezone"],
+            reply_markup=_make_timezone_keyboard(utc_time),
         )
 
     @classmethod
@@ -744,15 +635,8 @@ class CallbackQueryReplySender:
     ) -> None:
         """Asks "yes" or "no" (localized)."""
 
-        locale: Locale = context.user_data.locale
-
         await query.edit_message_text(
-            **make_dict_for_message_with_inline_keyboard(
-                message_text=context.bot_data.phrases[question_phrase_internal_id][locale],
-                buttons=make_buttons_yes_no(context),
-                buttons_per_row=2,
-                parse_mode=parse_mode,
-            )
+            **make_dict_for_message_yes_no(context, question_phrase_internal_id, parse_mode)
         )
 
     @classmethod
@@ -762,15 +646,16 @@ class CallbackQueryReplySender:
         query: CallbackQuery,
     ) -> None:
         """Sends message with SmallTalk URL to the user."""
-        bot_data = context.bot_data
-        locale: Locale = context.user_data.locale
-        url = context.user_data.student_smalltalk_interview_url
+        user_data = context.user_data
+        locale: Locale = user_data.locale
+        phrases = context.bot_data.phrases_for_locale[locale]
+        url = user_data.student_smalltalk_interview_url
 
         await query.edit_message_text(
-            bot_data.phrases["give_smalltalk_url"][locale]
+            phrases["give_smalltalk_url"]
             + (
                 f'\n\n<a href="{url}"><strong>'
-                f'{bot_data.phrases["give_smalltalk_url_link"][locale]}'
+                f'{phrases["give_smalltalk_url_link"]}'
                 "</strong></a>"
             ),
             parse_mode=ParseMode.HTML,
@@ -778,7 +663,7 @@ class CallbackQueryReplySender:
                 [
                     [
                         InlineKeyboardButton(
-                            bot_data.phrases["answer_smalltalk_done"][locale],
+                            phrases["answer_smalltalk_done"],
                             callback_data=CommonCallbackData.DONE,
                         )
                     ]
@@ -794,11 +679,12 @@ class CallbackQueryReplySender:
     ) -> None:
         """Show disclaimer on data processing according to GDPR."""
         locale: Locale = context.user_data.locale
+        phrases = context.bot_data.phrases_for_locale[locale]
 
         await query.edit_message_text(
             **make_dict_for_message_with_inline_keyboard(
-                message_text=context.bot_data.phrases["gdpr_disclaimer"][locale],
-                buttons=cls._create_disclaimer_buttons(context),
+                message_text=phrases["gdpr_disclaimer"],
+                buttons=context.bot_data.buttons_disclaimer_for_locale[locale],
                 buttons_per_row=2,
                 parse_mode=ParseMode.HTML,
             )
@@ -813,12 +699,13 @@ class CallbackQueryReplySender:
         """Show general disclaimer on volunteering with SSG (message text depends on role)."""
         user_data = context.user_data
         locale: Locale = user_data.locale
+        phrases = context.bot_data.phrases_for_locale[locale]
         role: Role = user_data.role
 
         await query.edit_message_text(
             **make_dict_for_message_with_inline_keyboard(
-                message_text=context.bot_data.phrases[f"general_disclaimer_{role}"][locale],
-                buttons=cls._create_disclaimer_buttons(context),
+                message_text=phrases[f"general_disclaimer_{role}"],
+                buttons=context.bot_data.buttons_disclaimer_for_locale[locale],
                 buttons_per_row=2,
                 parse_mode=ParseMode.HTML,
             )
@@ -832,26 +719,13 @@ class CallbackQueryReplySender:
     ) -> None:
         """Show disclaimer on legal risks of volunteering for an NGO for Russian citizens."""
         locale: Locale = context.user_data.locale
+        phrases = context.bot_data.phrases_for_locale[locale]
 
         await query.edit_message_text(
             **make_dict_for_message_with_inline_keyboard(
-                message_text=context.bot_data.phrases["legal_disclaimer"][locale],
-                buttons=cls._create_disclaimer_buttons(context),
+                message_text=phrases["legal_disclaimer"],
+                buttons=context.bot_data.buttons_disclaimer_for_locale[locale],
                 buttons_per_row=2,
                 parse_mode=ParseMode.HTML,
             )
         )
-
-    @staticmethod
-    def _create_disclaimer_buttons(context: CUSTOM_CONTEXT_TYPES) -> list[InlineKeyboardButton]:
-        locale: Locale = context.user_data.locale
-
-        phrase_for_callback_data = {
-            option: context.bot_data.phrases[f"disclaimer_option_{option}"][locale]
-            for option in (CommonCallbackData.OK, CommonCallbackData.ABORT)
-        }
-
-        return [
-            InlineKeyboardButton(text=value, callback_data=key)
-            for key, value in phrase_for_callback_data.items()
-        ]
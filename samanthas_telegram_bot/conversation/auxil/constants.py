@@ -0,0 +1,20 @@
+"""Telegram objects used in conversation that never change and hence can be created once."""
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardRemove
+
+from samanthas_telegram_bot.data_structures.constants import ENGLISH, RUSSIAN, UKRAINIAN
+
+EMPTY_INLINE_KEYBOARD = InlineKeyboardMarkup([])
+"""Keyboard for removing buttons from a message that is being edited."""
+
+KEYBOARD_CHOOSE_LOCALE = InlineKeyboardMarkup(
+    [
+        [InlineKeyboardButton(text="українською", callback_data=UKRAINIAN)],
+        [InlineKeyboardButton(text="in English", callback_data=ENGLISH)],
+        [InlineKeyboardButton(text="по-русски", callback_data=RUSSIAN)],
+    ]
+)
+"""Keyboard for choosing the language of the interface (the same for all users)."""
+
+REMOVE_REPLY_KEYBOARD = ReplyKeyboardRemove()
+"""Markup for removing a reply keyboard (e.g. the one for sharing the phone number)."""
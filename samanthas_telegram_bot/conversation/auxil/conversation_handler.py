@@ -287,10 +287,8 @@ states = {
         CallbackQueryHandler(common_main.show_review_menu),
     ],
     ConversationStateCommon.REVIEW_REQUESTED_ITEM: [
-        CallbackQueryHandler(review.first_name, pattern=UserDataReviewCategory.FIRST_NAME),
-        CallbackQueryHandler(review.last_name, pattern=UserDataReviewCategory.LAST_NAME),
+        CallbackQueryHandler(review.text_item, pattern=review.TEXT_ITEM_PATTERN),
         CallbackQueryHandler(review.phone, pattern=UserDataReviewCategory.PHONE_NUMBER),
-        CallbackQueryHandler(review.email, pattern=UserDataReviewCategory.EMAIL),
         CallbackQueryHandler(review.timezone, pattern=UserDataReviewCategory.TIMEZONE),
         CallbackQueryHandler(
             review.day_and_time_slots, pattern=UserDataReviewCategory.DAY_AND_TIME_SLOTS
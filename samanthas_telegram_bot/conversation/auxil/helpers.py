@@ -1,14 +1,41 @@
-from math import ceil
+import functools
+from collections.abc import Callable, Coroutine, Sequence
+from typing import Any
 
+import phonenumbers
 from telegram import CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.constants import ParseMode
 
 from samanthas_telegram_bot.auxil.constants import SPEAKING_CLUB_COORDINATOR_USERNAME
 from samanthas_telegram_bot.auxil.log_and_notify import logs
-from samanthas_telegram_bot.conversation.auxil.enums import CommonCallbackData
 from samanthas_telegram_bot.data_structures.context_types import CUSTOM_CONTEXT_TYPES
 from samanthas_telegram_bot.data_structures.enums import AgeRangeType, LoggingLevel
 
+_PHONE_NUMBER_SEPARATORS = str.maketrans("", "", " -().")
+"""Translation table for removing characters that `phonenumbers` ignores anyway."""
+
+
+def ignore_update_without_message(
+    callback: Callable[[Update, CUSTOM_CONTEXT_TYPES], Coroutine[Any, Any, int | None]]
+) -> Callable[[Update, CUSTOM_CONTEXT_TYPES], Coroutine[Any, Any, int | None]]:
+    """Decorator for callbacks that process a message the user has typed in.
+
+    It is impossible to send an empty message, but if for some reason user edits their previous
+    message, an update will be issued, but .message attribute will be none.
+    This would trigger an exception, although the bot won't stop working.  Still we don't want it.
+    So in this case just wait for user to type in the actual new message by returning them to the
+    same state again (returning ``None`` keeps the conversation in the current state).
+    """
+
+    # TODO an enhancement could be to store the information from the edited message
+    @functools.wraps(callback)
+    async def wrapper(update: Update, context: CUSTOM_CONTEXT_TYPES) -> int | None:
+        if update.message is None:
+            return None
+        return await callback(update, context)
+
+    return wrapper
+
 
 async def answer_callback_query_and_get_data(update: Update) -> tuple[CallbackQuery, str]:
     """Answers CallbackQuery and extracts data. Returns query and its data (string per definition).
@@ -21,6 +48,31 @@ async def answer_callback_query_and_get_data(update: Update) -> tuple[CallbackQu
     return query, query.data
 
 
+def format_phone_number_as_e164(phone_number: str) -> str | None:
+    """Parses the phone number the user has sent and returns it in E.164 format, or ``None``
+    if the number could not be parsed or is not valid.
+    """
+    # Hyphens, spaces, parentheses are OK for `phonenumbers`, but removing them lets the check
+    # for "+" below work for inputs like " +49..." or "(+49)...".
+    phone_number = phone_number.translate(_PHONE_NUMBER_SEPARATORS)
+    # Some devices leave out the "+" even when sharing the contact
+    if not (phone_number.startswith("00") or phone_number.startswith("+")):
+        phone_number = f"+{phone_number}"
+
+    try:
+        # Specifying a European region (Ireland in this case) will allow for both
+        # "+<country_code><number>" and "00<country_code><number>" to be parsed correctly.
+        # Any European region would work (GB, DE, etc.).  Ireland is used for sentimental reasons.
+        parsed_phone_number = phonenumbers.parse(number=phone_number, region="IE")
+    except phonenumbers.phonenumberutil.NumberParseException:
+        return None
+
+    if not phonenumbers.is_valid_number(parsed_phone_number):
+        return None
+
+    return phonenumbers.format_number(parsed_phone_number, phonenumbers.PhoneNumberFormat.E164)
+
+
 def make_buttons_with_age_ranges_for_students(
     context: CUSTOM_CONTEXT_TYPES,
 ) -> list[InlineKeyboardButton]:
@@ -33,22 +85,9 @@ def make_buttons_with_age_ranges_for_students(
     ]
 
 
-def make_buttons_yes_no(context: CUSTOM_CONTEXT_TYPES) -> list[InlineKeyboardButton]:
-    """Produces two buttons for inline keyboard: 'yes' and 'no' (localized)."""
-    phrase_for_callback_data = {
-        option: context.bot_data.phrases[f"option_{option}"][context.user_data.locale]
-        for option in (CommonCallbackData.YES, CommonCallbackData.NO)
-    }
-
-    return [
-        InlineKeyboardButton(text=value, callback_data=key)
-        for key, value in phrase_for_callback_data.items()
-    ]
-
-
 def make_dict_for_message_with_inline_keyboard(
     message_text: str,
-    buttons: list[InlineKeyboardButton],
+    buttons: Sequence[InlineKeyboardButton],
     buttons_per_row: int,
     bottom_row_button: InlineKeyboardButton = None,
     top_row_button: InlineKeyboardButton = None,
@@ -61,20 +100,16 @@ def make_dict_for_message_with_inline_keyboard(
     Returns dictionary that can be unpacked into await query.edit_message_text()
     """
 
-    number_of_rows = ceil(len(buttons) / buttons_per_row)
-
-    if number_of_rows == 0:
-        number_of_rows = 1
-
-    rows = []
+    rows: list[Sequence[InlineKeyboardButton]] = []
 
     if top_row_button:
         rows.append([top_row_button])
 
-    copied_buttons = buttons[:]
-    for _ in range(number_of_rows):
-        rows += [copied_buttons[:buttons_per_row]]  # it works even if there are fewer buttons left
-        del copied_buttons[:buttons_per_row]
+    # the last row can contain fewer buttons; keep one (empty) row if there are no buttons at all
+    rows += [
+        buttons[index : index + buttons_per_row]
+        for index in range(0, len(buttons), buttons_per_row)
+    ] or [[]]
 
     if bottom_row_button:
         rows.append([bottom_row_button])
@@ -91,12 +126,32 @@ def make_dict_for_message_to_ask_age_student(
     context: CUSTOM_CONTEXT_TYPES,
 ) -> dict[str, str | InlineKeyboardMarkup]:
     return make_dict_for_message_with_inline_keyboard(
-        message_text=context.bot_data.phrases["ask_age"][context.user_data.locale],
+        message_text=context.bot_data.phrases_for_locale[context.user_data.locale]["ask_age"],
         buttons=make_buttons_with_age_ranges_for_students(context),
         buttons_per_row=3,
     )
 
 
+def make_dict_for_message_yes_no(
+    context: CUSTOM_CONTEXT_TYPES,
+    question_phrase_internal_id: str,
+    parse_mode: ParseMode | None = ParseMode.HTML,
+) -> dict[str, str | InlineKeyboardMarkup]:
+    """Makes a message with a question and buttons 'yes' and 'no' (localized).
+
+    Returns dictionary that can be unpacked into await query.edit_message_text()
+    or await message.reply_text()
+    """
+    locale = context.user_data.locale
+
+    return {
+        "text": context.bot_data.phrases_for_locale[locale][question_phrase_internal_id],
+        "parse_mode": parse_mode,
+        "reply_markup": context.bot_data.keyboard_yes_no_for_locale[locale],
+        "disable_web_page_preview": True,
+    }
+
+
 async def notify_speaking_club_coordinator_about_high_level_student(
     update: Update, context: CUSTOM_CONTEXT_TYPES
 ) -> None:
@@ -126,12 +181,13 @@ async def prepare_assessment(update: Update, context: CUSTOM_CONTEXT_TYPES) -> N
     """
     # prepare questions and set index to 0
     user_data = context.user_data
+    chat_data = context.chat_data
 
     age_range_id = user_data.student_age_range_id
     age_range_for_log = f"{user_data.student_age_from}-{user_data.student_age_to} years old"
 
     try:
-        context.chat_data.assessment = context.bot_data.assessment_for_age_range_id[age_range_id]
+        chat_data.assessment = context.bot_data.assessment_for_age_range_id[age_range_id]
     except KeyError:
         await logs(
             bot=context.bot,
@@ -150,17 +206,20 @@ async def prepare_assessment(update: Update, context: CUSTOM_CONTEXT_TYPES) -> N
         user_data.student_assessment_answers = []
         user_data.student_assessment_resulting_level = None
         user_data.student_agreed_to_smalltalk = False
-        context.chat_data.current_assessment_question_index = 0
-        context.chat_data.current_assessment_question_id = context.chat_data.assessment.questions[
-            0
-        ].id
-        context.chat_data.ids_of_dont_know_options_in_assessment = {
-            option.id
-            for question in context.chat_data.assessment.questions
-            for option in question.options
-            if option.means_user_does_not_know_the_answer()
-        }
-        context.chat_data.assessment_dont_knows_in_a_row = 0
+        chat_data.current_assessment_question_index = 0
+        chat_data.current_assessment_question_id = chat_data.assessment.questions[0].id
+        chat_data.ids_of_dont_know_options_in_assessment = (
+            chat_data.assessment.ids_of_dont_know_options
+        )
+        chat_data.assessment_dont_knows_in_a_row = 0
+
+
+def store_utc_offset(context: CUSTOM_CONTEXT_TYPES, data: str) -> None:
+    """Stores UTC offset from callback data of timezone buttons (strings like "-8:00", "5:30")."""
+    # callback data is produced by the bot itself, so no need for a regex to validate it
+    hour, _, minute = data.partition(":")
+    context.user_data.utc_offset_hour = int(hour)
+    context.user_data.utc_offset_minute = int(minute)
 
 
 def store_selected_language_level(context: CUSTOM_CONTEXT_TYPES, level: str) -> None:
@@ -168,9 +227,11 @@ def store_selected_language_level(context: CUSTOM_CONTEXT_TYPES, level: str) ->
     bot_data = context.bot_data
     user_data = context.user_data
 
-    last_language_added = tuple(user_data.levels_for_teaching_language.keys())[-1]
+    levels_for_teaching_language = user_data.levels_for_teaching_language
+    # dictionaries preserve insertion order: get the last key without copying all keys
+    last_language_added = next(reversed(levels_for_teaching_language))
 
-    user_data.levels_for_teaching_language[last_language_added].append(level)
+    levels_for_teaching_language[last_language_added].append(level)
     user_data.language_and_level_ids.append(
         bot_data.language_and_level_id_for_language_id_and_level[(last_language_added, level)]
     )
@@ -1,25 +1,16 @@
 # This module contains some send_message operations that are too complex to be included in the main
 # code, and at the same time need to run multiple times.
 import datetime
-from collections import defaultdict
 from contextlib import suppress
 
 import telegram.error
-from telegram import (
-    InlineKeyboardButton,
-    InlineKeyboardMarkup,
-    KeyboardButton,
-    Message,
-    ReplyKeyboardMarkup,
-    Update,
-)
+from telegram import Message, Update
 from telegram.constants import ParseMode
 
-from samanthas_telegram_bot.conversation.auxil.enums import CommonCallbackData, ConversationMode
+from samanthas_telegram_bot.conversation.auxil.enums import ConversationMode
 from samanthas_telegram_bot.conversation.auxil.helpers import (
-    make_buttons_yes_no,
     make_dict_for_message_to_ask_age_student,
-    make_dict_for_message_with_inline_keyboard,
+    make_dict_for_message_yes_no,
 )
 from samanthas_telegram_bot.data_structures.context_types import CUSTOM_CONTEXT_TYPES
 from samanthas_telegram_bot.data_structures.enums import Role
@@ -64,23 +55,11 @@ class MessageSender:
         # but it's currently not needed in practice. But this one will come in handy during review.
         locale: Locale = context.user_data.locale
 
-        reply_markup = ReplyKeyboardMarkup(
-            [
-                [
-                    KeyboardButton(
-                        text=context.bot_data.phrases["share_phone"][locale],
-                        request_contact=True,
-                    )
-                ]
-            ],
-            one_time_keyboard=True,
-        )
-
         message = await update.effective_chat.send_message(
-            context.bot_data.phrases["ask_phone"][locale],
+            context.bot_data.phrases_for_locale[locale]["ask_phone"],
             disable_web_page_preview=True,  # the message contains link to site with country codes
             parse_mode=ParseMode.HTML,
-            reply_markup=reply_markup,
+            reply_markup=context.bot_data.keyboard_share_phone_for_locale[locale],
         )
         return message
 
@@ -89,29 +68,21 @@ class MessageSender:
         """Show message with main user info and ask user if corrections are needed."""
         await update.effective_chat.send_message(
             text=cls._prepare_message_for_review(context),
-            reply_markup=cls._prepare_reaction_buttons_for_review(context),
+            reply_markup=context.bot_data.keyboard_review_reaction_for_locale[
+                context.user_data.locale
+            ],
         )
 
     @staticmethod
     async def ask_store_username(update: Update, context: CUSTOM_CONTEXT_TYPES) -> None:
         """Asks if user's Telegram username should be stored or they want to give phone number."""
         locale: Locale = context.user_data.locale
+        phrases = context.bot_data.phrases_for_locale[locale]
         username = update.effective_user.username
 
         await update.effective_chat.send_message(
-            f"{context.bot_data.phrases['ask_username_1'][locale]} @{username}"
-            f"{context.bot_data.phrases['ask_username_2'][locale]}",
-            reply_markup=InlineKeyboardMarkup(
-                [
-                    [
-                        InlineKeyboardButton(
-                            text=context.bot_data.phrases[f"username_reply_{option}"][locale],
-                            callback_data=f"store_username_{option}",
-                        )
-                    ]  # each button in its own row
-                    for option in (CommonCallbackData.YES, CommonCallbackData.NO)
-                ]
-            ),
+            f"{phrases['ask_username_1']} @{username}{phrases['ask_username_2']}",
+            reply_markup=context.bot_data.keyboard_store_username_for_locale[locale],
         )
 
     @classmethod
@@ -131,14 +102,7 @@ class MessageSender:
         parse_mode: ParseMode | None = ParseMode.HTML,
     ) -> None:
         """Ask "yes" or "no" (localized)."""
-        locale: Locale = context.user_data.locale
-
-        data = make_dict_for_message_with_inline_keyboard(
-            message_text=context.bot_data.phrases[question_phrase_internal_id][locale],
-            buttons=make_buttons_yes_no(context),
-            buttons_per_row=2,
-            parse_mode=parse_mode,
-        )
+        data = make_dict_for_message_yes_no(context, question_phrase_internal_id, parse_mode)
         try:
             await update.message.reply_text(**data)
         except AttributeError:
@@ -190,120 +154,85 @@ class MessageSender:
             == ConversationMode.REGISTRATION_MAIN_FLOW
         ):
             await update.effective_chat.send_message(
-                context.bot_data.phrases["note_editable_fields"][locale],
+                context.bot_data.phrases_for_locale[locale]["note_editable_fields"],
                 parse_mode=ParseMode.HTML,
             )
 
-    @staticmethod
-    def _prepare_reaction_buttons_for_review(
-        context: CUSTOM_CONTEXT_TYPES,
-    ) -> InlineKeyboardMarkup:
-        locale: Locale = context.user_data.locale
-
-        buttons = [
-            InlineKeyboardButton(
-                text=context.bot_data.phrases["review_reaction_" + option][locale],
-                callback_data=option,
-            )
-            for option in ("yes", "no")
-        ]
-
-        # each button in a separate list to put them into rows of one single column
-        return InlineKeyboardMarkup([[buttons[0]], [buttons[1]]])
-
     @staticmethod
     def _prepare_message_for_review(context: CUSTOM_CONTEXT_TYPES) -> str:
         """Prepares text message with user info for review, depending on role and other factors."""
         user_data = context.user_data
-        locale: Locale = user_data.locale
-        phrases = context.bot_data.phrases
-
-        message = (
-            f"{phrases['ask_review'][locale]}\n\n"
-            f"{phrases['review_first_name'][locale]}: {user_data.first_name}\n"
-            f"{phrases['review_last_name'][locale]}: {user_data.last_name}\n"
-            f"{phrases['review_email'][locale]}: {user_data.email}\n"
-        )
+        phrases = context.bot_data.phrases_for_locale[user_data.locale]
+
+        parts = [
+            f"{phrases['ask_review']}\n\n"
+            f"{phrases['review_first_name']}: {user_data.first_name}\n"
+            f"{phrases['review_last_name']}: {user_data.last_name}\n"
+            f"{phrases['review_email']}: {user_data.email}\n"
+        ]
 
         if user_data.role == Role.STUDENT:
-            message += (
-                f"{phrases['review_student_age_group'][locale]}: "
+            parts.append(
+                f"{phrases['review_student_age_group']}: "
                 f"{user_data.student_age_from}-{user_data.student_age_to}\n"
             )
         # TODO add students' age ranges for teacher? This will require changes to UserData
 
         if user_data.tg_username:
-            message += f"{phrases['review_username'][locale]} (@{user_data.tg_username})\n"
+            parts.append(f"{phrases['review_username']} (@{user_data.tg_username})\n")
         if user_data.phone_number:
-            message += f"{phrases['review_phone_number'][locale]}: {user_data.phone_number}\n"
-
-        message += f"{phrases['review_communication_language'][locale]}: "
-        message += (
-            phrases[
-                f"class_communication_language_option_{user_data.communication_language_in_class}"
-            ][locale]
-            + "\n"
-        )
+            parts.append(f"{phrases['review_phone_number']}: {user_data.phone_number}\n")
+
+        communication_language = phrases[
+            f"class_communication_language_option_{user_data.communication_language_in_class}"
+        ]
+        parts.append(f"{phrases['review_communication_language']}: {communication_language}\n")
 
         offset_hour = user_data.utc_offset_hour
-        offset_minute = str(user_data.utc_offset_minute).zfill(2)  # to produce "00" from 0
+        offset_minute = user_data.utc_offset_minute
 
         if user_data.utc_offset_hour > 0:
-            message += f"{phrases['review_timezone'][locale]}: UTC+{offset_hour}"
+            parts.append(f"{phrases['review_timezone']}: UTC+{offset_hour}")
         elif user_data.utc_offset_hour < 0:
-            message += f"{phrases['review_timezone'][locale]}: UTC{offset_hour}"
+            parts.append(f"{phrases['review_timezone']}: UTC{offset_hour}")
         else:
-            message += f"\n{phrases['review_timezone'][locale]}: UTC"
+            parts.append(f"\n{phrases['review_timezone']}: UTC")
 
         utc_time = datetime.datetime.now(tz=datetime.timezone.utc)
         now_with_offset = utc_time + datetime.timedelta(
             hours=user_data.utc_offset_hour, minutes=user_data.utc_offset_minute
         )
-        message += (
-            f" ({phrases['current_time'][locale]} " f"{now_with_offset.strftime('%H:%M')})\n"
-        )
+        parts.append(f" ({phrases['current_time']} {now_with_offset.strftime('%H:%M')})\n")
 
         # the rest is for non-coordinators only
         if user_data.role == Role.COORDINATOR:
-            return message
-
-        message += f"\n{phrases['review_availability'][locale]}:\n"
-
-        slot_ids = sorted(user_data.day_and_time_slot_ids)
-        # creating a dictionary matching days to lists of slots, so that slots can be shown to
-        # user grouped by a day of the week
-        slot_id_for_day_index: dict[int, list[int]] = defaultdict(list)
-
-        for slot_id in slot_ids:
-            slot_id_for_day_index[
-                context.bot_data.day_and_time_slot_for_slot_id[slot_id].day_of_week_index
-            ].append(slot_id)
+            return "".join(parts)
 
-        for day_index in slot_id_for_day_index:
-            message += f"{phrases['ask_slots_' + str(day_index)][locale]}: "
+        parts.append(f"\n{phrases['review_availability']}:\n")
 
-            for slot_id in slot_id_for_day_index[day_index]:
-                slot = context.bot_data.day_and_time_slot_for_slot_id[slot_id]
+        # Slots in bot data are already grouped by day of the week and ordered as in the keyboards,
+        # so there is no need to sort and group the user's selection.
+        selected_slot_ids = frozenset(user_data.day_and_time_slot_ids)
 
-                # User must see their slots in their chosen timezone.
-                # % 24 is needed to avoid showing 22:00-25:00 to the user
-                message += (
-                    f" {(slot.from_utc_hour + offset_hour) % 24}:{offset_minute}-"
-                    f"{(slot.to_utc_hour + offset_hour) % 24}:{offset_minute};"
-                )
-            else:  # remove last semicolon, end day with line break
-                message = message[:-1] + "\n"
-        message += "\n"
+        for day_index, slots_for_day in enumerate(
+            context.bot_data.day_and_time_slots_for_day_index
+        ):
+            slots = [slot for slot in slots_for_day if slot.id in selected_slot_ids]
+            if not slots:
+                continue
+            # User must see their slots in their chosen timezone.
+            slots_text = ";".join(
+                " " + slot.label_for_utc_offset(offset_hour, offset_minute) for slot in slots
+            )
+            parts.append(f"{phrases['ask_slots_' + str(day_index)]}: {slots_text}\n")
+        parts.append("\n")
 
         # Because of complex logic around English, we will not offer the student to review their
         # language/level for now.  This option will be reserved for teachers.
         if user_data.role == Role.TEACHER:
-            message += f"{phrases['review_languages_levels'][locale]}:\n"
-            for language in user_data.levels_for_teaching_language:
-                message += f"{phrases[language][locale]}: "
-                message += (
-                    ", ".join(sorted(user_data.levels_for_teaching_language[language])) + "\n"
-                )
-            message += "\n"
+            parts.append(f"{phrases['review_languages_levels']}:\n")
+            for language, levels in user_data.levels_for_teaching_language.items():
+                parts.append(f"{phrases[language]}: {', '.join(sorted(levels))}\n")
+            parts.append("\n")
 
-        return message
+        return "".join(parts)
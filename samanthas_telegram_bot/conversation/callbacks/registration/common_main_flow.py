@@ -1,14 +1,7 @@
 import asyncio
 import typing
 
-import phonenumbers
-from telegram import (
-    InlineKeyboardButton,
-    InlineKeyboardMarkup,
-    MenuButtonCommands,
-    ReplyKeyboardRemove,
-    Update,
-)
+from telegram import MenuButtonCommands, Update
 from telegram.constants import ParseMode
 from telegram.ext import ConversationHandler
 
@@ -22,10 +15,15 @@ from samanthas_telegram_bot.auxil.constants import (
     EMAIL_PATTERN,
     RUSSIAN_DOMAINS,
 )
-from samanthas_telegram_bot.auxil.log_and_notify import logs
+from samanthas_telegram_bot.auxil.log_and_notify import is_logging_enabled_for, logs
 from samanthas_telegram_bot.conversation.auxil.callback_query_reply_sender import (
     CallbackQueryReplySender as CQReplySender,
 )
+from samanthas_telegram_bot.conversation.auxil.constants import (
+    EMPTY_INLINE_KEYBOARD,
+    KEYBOARD_CHOOSE_LOCALE,
+    REMOVE_REPLY_KEYBOARD,
+)
 from samanthas_telegram_bot.conversation.auxil.enums import ConversationMode
 from samanthas_telegram_bot.conversation.auxil.enums import ConversationStateCommon as CommonState
 from samanthas_telegram_bot.conversation.auxil.enums import (
@@ -40,16 +38,13 @@ from samanthas_telegram_bot.conversation.auxil.enums import (
 from samanthas_telegram_bot.conversation.auxil.enums import ConversationStateTeacherUnder18
 from samanthas_telegram_bot.conversation.auxil.helpers import (
     answer_callback_query_and_get_data,
+    format_phone_number_as_e164,
+    ignore_update_without_message,
     notify_speaking_club_coordinator_about_high_level_student,
+    store_utc_offset,
 )
 from samanthas_telegram_bot.conversation.auxil.message_sender import MessageSender
-from samanthas_telegram_bot.data_structures.constants import (
-    ENGLISH,
-    LEVELS_TOO_HIGH,
-    LOCALES,
-    RUSSIAN,
-    UKRAINIAN,
-)
+from samanthas_telegram_bot.data_structures.constants import LEVELS_TOO_HIGH, UKRAINIAN
 from samanthas_telegram_bot.data_structures.context_types import CUSTOM_CONTEXT_TYPES
 from samanthas_telegram_bot.data_structures.enums import LoggingLevel, Role
 from samanthas_telegram_bot.data_structures.literal_types import Locale
@@ -75,29 +70,24 @@ async def start(update: Update, context: CUSTOM_CONTEXT_TYPES) -> int:
         ConversationMode.REGISTRATION_MAIN_FLOW
     )
 
-    await update.effective_chat.set_menu_button(MenuButtonCommands())
-
     chat_data.reset()
     user_data.reset()
 
     user_data.chat_id = update.effective_chat.id
 
-    greeting = "🚧 ТЕСТОВИЙ РЕЖИМ | TEST MODE 🚧\n\n"  # noqa # TODO remove going to production
-    for locale in LOCALES:
-        greeting += (
-            f"{bot_data.phrases['hello'][locale]} {update.message.from_user.first_name}! "
-            f"{bot_data.phrases['choose_language_of_conversation'][locale]}\n\n"
-        )
+    greeting = (
+        "🚧 ТЕСТОВИЙ РЕЖИМ | TEST MODE 🚧\n\n"  # noqa # TODO remove going to production
+        + bot_data.greeting_template.format(name=update.message.from_user.first_name)
+    )
 
-    await update.message.reply_text(
-        greeting,
-        parse_mode=ParseMode.HTML,
-        reply_markup=InlineKeyboardMarkup(
-            [
-                [InlineKeyboardButton(text="українською", callback_data=UKRAINIAN)],
-                [InlineKeyboardButton(text="in English", callback_data=ENGLISH)],
-                [InlineKeyboardButton(text="по-русски", callback_data=RUSSIAN)],
-            ]
+    # These two requests to Telegram don't depend on each other, so there's no need to wait
+    # for one of them to complete before sending the other one.
+    await asyncio.gather(
+        update.effective_chat.set_menu_button(MenuButtonCommands()),
+        update.message.reply_text(
+            greeting,
+            parse_mode=ParseMode.HTML,
+            reply_markup=KEYBOARD_CHOOSE_LOCALE,
         ),
     )
 
@@ -139,8 +129,8 @@ async def redirect_registered_user_to_coordinator(
 
     locale: Locale = context.user_data.locale
     await query.edit_message_text(
-        context.bot_data.phrases["reply_go_to_other_chat"][locale],
-        reply_markup=InlineKeyboardMarkup([]),
+        context.bot_data.phrases_for_locale[locale]["reply_go_to_other_chat"],
+        reply_markup=EMPTY_INLINE_KEYBOARD,
     )
     return CommonState.CHAT_WITH_OPERATOR
 
@@ -177,8 +167,8 @@ async def say_bye_if_does_not_want_to_register_another_person(
 
     locale: Locale = context.user_data.locale
     await query.edit_message_text(
-        context.bot_data.phrases["bye_wait_for_message_from_bot"][locale],
-        reply_markup=InlineKeyboardMarkup([]),
+        context.bot_data.phrases_for_locale[locale]["bye_wait_for_message_from_bot"],
+        reply_markup=EMPTY_INLINE_KEYBOARD,
     )
     return CommonState.CHAT_WITH_OPERATOR
 
@@ -230,8 +220,8 @@ async def say_bye_if_disclaimer_not_accepted(update: Update, context: CUSTOM_CON
     )
     locale: Locale = context.user_data.locale
     await query.edit_message_text(
-        context.bot_data.phrases["bye_cancel"][locale],
-        reply_markup=InlineKeyboardMarkup([]),
+        context.bot_data.phrases_for_locale[locale]["bye_cancel"],
+        reply_markup=EMPTY_INLINE_KEYBOARD,
     )
     return ConversationHandler.END
 
@@ -249,69 +239,59 @@ async def ask_first_name(update: Update, context: CUSTOM_CONTEXT_TYPES) -> int:
     return CommonState.ASK_LAST_NAME
 
 
+@ignore_update_without_message
 async def store_first_name_ask_last_name(
     update: Update, context: CUSTOM_CONTEXT_TYPES
 ) -> int | None:
     """Stores the first name and asks the last name."""
+    bot_data = context.bot_data
+    user_data = context.user_data
 
     # It is better for less ambiguity to ask first name and last name in separate questions
 
-    # It is impossible to send an empty message, but if for some reason user edits their previous
-    # message, an update will be issued, but .message attribute will be none.
-    # This will trigger an exception, although the bot won't stop working.  Still we don't want it.
-    # So in this case just wait for user to type in the actual new message by returning him to the
-    # same state again.
-    # This can be potentially refactored, but unless more functionality is needed, it would result
-    # in something like complex decorator, so not doing it yet.
-    # TODO an enhancement could be to store the information from the edited message
-    if update.message is None:
-        return None
-
-    context.user_data.first_name = update.message.text
+    user_data.first_name = update.message.text
 
     if (
-        context.bot_data.conversation_mode_for_chat_id[context.user_data.chat_id]
+        bot_data.conversation_mode_for_chat_id[user_data.chat_id]
         == ConversationMode.REGISTRATION_REVIEW
     ):
         await update.message.delete()
         await MessageSender.delete_message_and_ask_review(update, context)
         return CommonState.ASK_FINAL_COMMENT_OR_SHOW_REVIEW_MENU
 
-    locale: Locale = context.user_data.locale
-    await update.message.reply_text(context.bot_data.phrases["ask_last_name"][locale])
+    locale: Locale = user_data.locale
+    await update.message.reply_text(bot_data.phrases_for_locale[locale]["ask_last_name"])
     return CommonState.ASK_SOURCE
 
 
+@ignore_update_without_message
 async def store_last_name_ask_source(update: Update, context: CUSTOM_CONTEXT_TYPES) -> int | None:
     """Stores the last name and asks the user how they found out about Samantha's Group."""
+    bot_data = context.bot_data
+    user_data = context.user_data
 
-    if update.message is None:
-        return None
-
-    context.user_data.last_name = update.message.text
+    user_data.last_name = update.message.text
 
     # TODO factor out
     if (
-        context.bot_data.conversation_mode_for_chat_id[context.user_data.chat_id]
+        bot_data.conversation_mode_for_chat_id[user_data.chat_id]
         == ConversationMode.REGISTRATION_REVIEW
     ):
         await update.message.delete()
         await MessageSender.delete_message_and_ask_review(update, context)
         return CommonState.ASK_FINAL_COMMENT_OR_SHOW_REVIEW_MENU
 
-    locale: Locale = context.user_data.locale
-    await update.effective_chat.send_message(context.bot_data.phrases["ask_source"][locale])
+    locale: Locale = user_data.locale
+    await update.effective_chat.send_message(bot_data.phrases_for_locale[locale]["ask_source"])
     return CommonState.CHECK_USERNAME
 
 
+@ignore_update_without_message
 async def store_source_check_username(update: Update, context: CUSTOM_CONTEXT_TYPES) -> int | None:
     """Stores the source of knowledge about SSG, checks Telegram nickname or asks for
     phone number.
     """
 
-    if update.message is None:
-        return None
-
     context.user_data.source = update.message.text
 
     if update.effective_user.username:
@@ -327,102 +307,82 @@ async def store_username_if_available_ask_phone_or_email(
 
     If the user provides their username, ask their email (skip asking for phone number).
     """
+    user_data = context.user_data
 
     username = update.effective_user.username
 
     query, data = await answer_callback_query_and_get_data(update)
 
     if data == "store_username_yes" and username:
-        context.user_data.phone_number = None  # in case it was entered at previous run of the bot
-        context.user_data.tg_username = username
+        user_data.phone_number = None  # in case it was entered at previous run of the bot
+        user_data.tg_username = username
         await logs(
             bot=context.bot,
             text=f"{username=} will be stored in the database.",
             update=update,
         )
-        locale: Locale = context.user_data.locale
+        locale: Locale = user_data.locale
         await query.edit_message_text(
-            context.bot_data.phrases["ask_email"][locale],
-            reply_markup=InlineKeyboardMarkup([]),
+            context.bot_data.phrases_for_locale[locale]["ask_email"],
+            reply_markup=EMPTY_INLINE_KEYBOARD,
         )
         return CommonState.ASK_AGE_OR_BYE_IF_PERSON_EXISTS
 
-    context.user_data.tg_username = None
+    user_data.tg_username = None
     await query.delete_message()
 
     await MessageSender.ask_phone_number(update, context)
     return CommonState.ASK_EMAIL
 
 
+@ignore_update_without_message
 async def store_phone_ask_email(update: Update, context: CUSTOM_CONTEXT_TYPES) -> int | None:
     """Stores the phone number and asks for email."""
+    bot_data = context.bot_data
+    user_data = context.user_data
 
-    if update.message is None:
-        return None
-
-    locale: Locale = context.user_data.locale
+    locale: Locale = user_data.locale
+    phrases = bot_data.phrases_for_locale[locale]
 
     # 1. Read phone number
-    phone_number_to_parse = (
+    phone_number_as_sent = (
         update.message.contact.phone_number if update.message.contact else update.message.text
     )
-    # Hyphens, spaces, parentheses are OK for `phonenumbers`, but some devices leave out the "+"
-    # even when sharing the contact
-    if not (phone_number_to_parse.startswith("00") or phone_number_to_parse.startswith("+")):
-        phone_number_to_parse = f"+{phone_number_to_parse}"
 
-    # 2. Parse phone number
-    try:
-        # Specifying a European region (Ireland in this case) will allow for both
-        # "+<country_code><number>" and "00<country_code><number>" to be parsed correctly.
-        # Any European region would work (GB, DE, etc.).  Ireland is used for sentimental reasons.
-        parsed_phone_number = phonenumbers.parse(number=phone_number_to_parse, region="IE")
-    except phonenumbers.phonenumberutil.NumberParseException:
-        await logs(
-            bot=context.bot,
-            level=LoggingLevel.WARNING,
-            update=update,
-            text=f"Could not parse phone number {phone_number_to_parse}",
-        )
-        parsed_phone_number = None
-
-    # 3. Check validity and return user to same state if phone number not valid
-    if parsed_phone_number and phonenumbers.is_valid_number(parsed_phone_number):
-        context.user_data.phone_number = phonenumbers.format_number(
-            parsed_phone_number, phonenumbers.PhoneNumberFormat.E164
-        )
+    # 2. Parse phone number, check validity and return user to same state if it is not valid
+    phone_number = format_phone_number_as_e164(phone_number_as_sent)
+    if phone_number:
+        user_data.phone_number = phone_number
     else:
         await logs(
             bot=context.bot,
             level=LoggingLevel.WARNING,
             update=update,
-            text=(
-                f"Invalid phone number {parsed_phone_number} "
-                f"(parsed from {phone_number_to_parse})"
-            ),
+            text=f"Could not parse or invalid phone number {phone_number_as_sent}",
         )
         await update.message.reply_text(
-            f"{phone_number_to_parse} {context.bot_data.phrases['invalid_phone_number'][locale]}",
+            f"{phone_number_as_sent} {phrases['invalid_phone_number']}",
         )
         return CommonState.ASK_EMAIL
 
     if (
-        context.bot_data.conversation_mode_for_chat_id[context.user_data.chat_id]
+        bot_data.conversation_mode_for_chat_id[user_data.chat_id]
         == ConversationMode.REGISTRATION_REVIEW
     ):
         await update.message.delete()
         await MessageSender.delete_message_and_ask_review(update, context)
         return CommonState.ASK_FINAL_COMMENT_OR_SHOW_REVIEW_MENU
 
-    await update.message.reply_text(context.bot_data.phrases["ask_email"][locale])
+    await update.message.reply_text(phrases["ask_email"])
     await logs(
         bot=context.bot,
         update=update,
-        text=f"Phone number: {context.user_data.phone_number}",
+        text=f"Phone number: {user_data.phone_number}",
     )
     return CommonState.ASK_AGE_OR_BYE_IF_PERSON_EXISTS
 
 
+@ignore_update_without_message
 async def store_email_check_existence_ask_age(
     update: Update, context: CUSTOM_CONTEXT_TYPES
 ) -> int | None:
@@ -432,22 +392,18 @@ async def store_email_check_existence_ask_age(
     Otherwise, asks age depending on role ("Are you 18+" for teacher, age group for student).
     """
 
-    if update.message is None:
-        return None
-
     bot_data = context.bot_data
-    phrases = bot_data.phrases
-
     user_data = context.user_data
     locale: Locale = user_data.locale
+    phrases = bot_data.phrases_for_locale[locale]
 
     email = update.message.text.strip()
-    if not EMAIL_PATTERN.match(email):
-        await update.message.reply_text(phrases["invalid_email"][locale])
+    if not EMAIL_PATTERN.fullmatch(email):
+        await update.message.reply_text(phrases["invalid_email"])
         return None
 
-    if any(email.endswith(domain) for domain in RUSSIAN_DOMAINS):
-        await update.message.reply_text(phrases["russian_email"][locale])
+    if email.endswith(RUSSIAN_DOMAINS):
+        await update.message.reply_text(phrases["russian_email"])
         return None
 
     user_data.email = email
@@ -464,13 +420,13 @@ async def store_email_check_existence_ask_age(
             # Backend's rules for email validity can be different, and regex check (done above)
             # may not guarantee that the backend will accept the email.
             await logs(bot=context.bot, update=update, text=f"Backend is not happy with {email=}")
-            await update.message.reply_text(phrases["invalid_email"][locale])
+            await update.message.reply_text(phrases["invalid_email"])
             return CommonState.ASK_AGE_OR_BYE_IF_PERSON_EXISTS
         else:
             raise BackendClientError("An error occurred not related to email validation") from err
 
     if person_exists:
-        await update.message.reply_text(phrases["user_already_exists"][locale])
+        await update.message.reply_text(phrases["user_already_exists"])
         return CommonState.CHAT_WITH_OPERATOR
 
     if (
@@ -526,7 +482,7 @@ async def ask_young_teacher_if_can_host_speaking_club_or_bye_to_young_coordinato
         return ConversationStateTeacherUnder18.ASK_COMMUNICATION_LANGUAGE_OR_BYE
     elif role == Role.COORDINATOR:
         await update.callback_query.edit_message_text(
-            context.bot_data.phrases["reply_cannot_work"][locale]
+            context.bot_data.phrases_for_locale[locale]["reply_cannot_work"]
         )
         return ConversationHandler.END
     else:
@@ -538,7 +494,9 @@ async def bye_cannot_work(update: Update, context: CUSTOM_CONTEXT_TYPES) -> int:
     await update.callback_query.answer()
     locale: Locale = context.user_data.locale
 
-    await update.effective_chat.send_message(context.bot_data.phrases["reply_cannot_work"][locale])
+    await update.effective_chat.send_message(
+        context.bot_data.phrases_for_locale[locale]["reply_cannot_work"]
+    )
     return ConversationHandler.END
 
 
@@ -551,11 +509,7 @@ async def store_timezone_ask_slots_for_monday(
     """Stores timezone, asks time slots for Monday."""
 
     query, data = await answer_callback_query_and_get_data(update)
-    user_data = context.user_data
-
-    user_data.utc_offset_hour, user_data.utc_offset_minute = (
-        int(item) for item in data.split(":")
-    )
+    store_utc_offset(context, data)
 
     if (
         context.bot_data.conversation_mode_for_chat_id[context.user_data.chat_id]
@@ -589,16 +543,17 @@ async def store_last_time_slot_ask_slots_for_next_day_or_teaching_language(
     user_data = context.user_data
 
     # If we haven't yet reached Sunday, move on to next day and ask slots for it
-    if chat_data.day_index < 6:
-        chat_data.day_index += 1
+    day_index = chat_data.day_index
+    if day_index < 6:
+        chat_data.day_index = day_index + 1
         await query.answer()
         await CQReplySender.ask_time_slot(context, query)
         return CommonState.TIME_SLOTS_MENU_OR_ASK_TEACHING_LANGUAGE
 
     # We have reached Sunday
+    slot_ids = user_data.day_and_time_slot_ids
     slots_for_logging = (
-        context.bot_data.day_and_time_slot_for_slot_id[slot_id]
-        for slot_id in sorted(user_data.day_and_time_slot_ids)
+        bot_data.day_and_time_slot_for_slot_id[slot_id] for slot_id in sorted(slot_ids)
     )
     await logs(
         bot=context.bot,
@@ -609,10 +564,10 @@ async def store_last_time_slot_ask_slots_for_next_day_or_teaching_language(
     # reset day of week to Monday for possible review or re-run
     chat_data.day_index = 0
 
-    if not any(user_data.day_and_time_slot_ids):
+    if not slot_ids:
         locale: Locale = user_data.locale
         await query.answer(
-            context.bot_data.phrases["no_slots_selected"][locale],
+            bot_data.phrases_for_locale[locale]["no_slots_selected"],
             show_alert=True,
         )
         await logs(
@@ -624,7 +579,7 @@ async def store_last_time_slot_ask_slots_for_next_day_or_teaching_language(
         return CommonState.TIME_SLOTS_MENU_OR_ASK_TEACHING_LANGUAGE
 
     if (
-        bot_data.conversation_mode_for_chat_id[context.user_data.chat_id]
+        bot_data.conversation_mode_for_chat_id[user_data.chat_id]
         == ConversationMode.REGISTRATION_REVIEW
     ):
         await query.answer()
@@ -658,7 +613,7 @@ async def ask_final_comment(update: Update, context: CUSTOM_CONTEXT_TYPES) -> in
 
     # We don't call edit_message_text(): let user info remain in the chat for user to see,
     # but remove the buttons.
-    await query.edit_message_reply_markup(InlineKeyboardMarkup([]))
+    await query.edit_message_reply_markup(EMPTY_INLINE_KEYBOARD)
 
     await MessageSender.ask_yes_no(
         update, context, question_phrase_internal_id="ask_final_comment"
@@ -683,7 +638,9 @@ async def ask_text_of_final_comment(update: Update, context: CUSTOM_CONTEXT_TYPE
     """Ask for final comment."""
     query, _ = await answer_callback_query_and_get_data(update)
     locale: Locale = context.user_data.locale
-    await query.edit_message_text(context.bot_data.phrases["ask_final_comment_text"][locale])
+    await query.edit_message_text(
+        context.bot_data.phrases_for_locale[locale]["ask_final_comment_text"]
+    )
 
     return CommonState.FINISH_REGISTRATION
 
@@ -697,10 +654,10 @@ async def store_comment_create_person_start_helpdesk_chat(
     For others, store the general comment."""
     user_data = context.user_data
     locale: Locale = user_data.locale
-    phrases = context.bot_data.phrases
+    phrases = context.bot_data.phrases_for_locale[locale]
     role = user_data.role
 
-    wait_phrase = phrases["processing_wait"][locale]
+    wait_phrase = phrases["processing_wait"]
     if update.message:
         user_data.comment = update.message.text
         # saving returned Message to edit its text later on
@@ -710,7 +667,7 @@ async def store_comment_create_person_start_helpdesk_chat(
         query, _ = await answer_callback_query_and_get_data(update)
         user_data.comment = ""
         wait_message = await query.edit_message_text(
-            wait_phrase, reply_markup=InlineKeyboardMarkup([])
+            wait_phrase, reply_markup=EMPTY_INLINE_KEYBOARD
         )
 
     # Initiate conversation in helpdesk
@@ -748,18 +705,18 @@ async def store_comment_create_person_start_helpdesk_chat(
 
     # number of groups is None for young teachers and zero for adults that only want speaking club
     if role == Role.TEACHER and not user_data.teacher_number_of_groups:
-        text = phrases["bye_wait_for_message_from_coordinator"][locale]
+        text = phrases["bye_wait_for_message_from_coordinator"]
     elif role == Role.STUDENT and user_data.student_needs_oral_interview is True:
-        text = phrases["bye_go_to_chat_with_coordinator"][locale]
+        text = phrases["bye_go_to_chat_with_coordinator"]
     elif role == Role.STUDENT and user_data.student_assessment_resulting_level in LEVELS_TOO_HIGH:
         # Students with high results in SmallTalk get their own state (above).
         # Here we're handling those who got high level in "written" assessment and decided to go on
         # with registration despite the fact that they will only be able to attend Speaking Club.
-        text = f"{phrases['student_level_too_high_we_will_email_you'][locale]} {user_data.email}"
+        text = f"{phrases['student_level_too_high_we_will_email_you']} {user_data.email}"
     elif role == Role.COORDINATOR:
-        text = phrases["bye_to_coordinator_candidate"][locale]
+        text = phrases["bye_to_coordinator_candidate"]
     else:
-        text = phrases["bye_wait_for_message_from_bot"][locale]
+        text = phrases["bye_wait_for_message_from_bot"]
 
     if personal_info_id:
         await wait_message.edit_text(text)
@@ -794,8 +751,8 @@ async def say_bye(update: Update, context: CUSTOM_CONTEXT_TYPES) -> int:
     locale: Locale = context.user_data.locale
     await logs(bot=context.bot, text="Cancelling registration.", update=update)
     await query.edit_message_text(
-        context.bot_data.phrases["bye"][locale],
-        reply_markup=InlineKeyboardMarkup([]),
+        context.bot_data.phrases_for_locale[locale]["bye"],
+        reply_markup=EMPTY_INLINE_KEYBOARD,
     )
     return CommonState.CHAT_WITH_OPERATOR
 
@@ -816,7 +773,8 @@ async def cancel(update: Update, context: CUSTOM_CONTEXT_TYPES) -> int:
         locale = typing.cast(Locale, update.effective_user.language_code)
 
     await update.message.reply_text(
-        context.bot_data.phrases["bye_cancel"][locale], reply_markup=ReplyKeyboardRemove()
+        context.bot_data.phrases_for_locale[locale]["bye_cancel"],
+        reply_markup=REMOVE_REPLY_KEYBOARD,
     )
 
     return CommonState.CHAT_WITH_OPERATOR
@@ -827,8 +785,8 @@ async def send_help(update: Update, context: CUSTOM_CONTEXT_TYPES) -> None:
 
     locale: Locale = context.user_data.locale or UKRAINIAN
     await update.message.reply_text(
-        f"{context.bot_data.phrases['help'][locale]} @{BOT_TECH_SUPPORT_USERNAME}",
-        reply_markup=ReplyKeyboardRemove(),
+        f"{context.bot_data.phrases_for_locale[locale]['help']} @{BOT_TECH_SUPPORT_USERNAME}",
+        reply_markup=REMOVE_REPLY_KEYBOARD,
     )
 
 
@@ -888,23 +846,24 @@ async def message_fallback(update: Update, context: CUSTOM_CONTEXT_TYPES) -> Non
     user_data = context.user_data
     chat_id = user_data.chat_id
 
-    await logs(
-        bot=context.bot,
-        update=update,
-        level=LoggingLevel.DEBUG,
-        text=(
-            "This is message fallback. "
-            f"Chat mode: {bot_data.conversation_mode_for_chat_id[chat_id]}. "
-            f"Effective message: {update.effective_message}"
-        ),
-    )
+    if is_logging_enabled_for(LoggingLevel.DEBUG):
+        await logs(
+            bot=context.bot,
+            update=update,
+            level=LoggingLevel.DEBUG,
+            text=(
+                "This is message fallback. "
+                f"Chat mode: {bot_data.conversation_mode_for_chat_id[chat_id]}. "
+                f"Effective message: {update.effective_message}"
+            ),
+        )
 
     if update.message is not None:
         await update.message.delete()
 
     locale: Locale = user_data.locale or UKRAINIAN
     message = await update.effective_chat.send_message(
-        f"{bot_data.phrases['message_fallback'][locale]} @{BOT_TECH_SUPPORT_USERNAME}",
+        f"{bot_data.phrases_for_locale[locale]['message_fallback']} @{BOT_TECH_SUPPORT_USERNAME}",
         parse_mode=ParseMode.HTML,
     )
     await asyncio.sleep(5)
@@ -7,46 +7,49 @@ Since chat is supposed to be in review mode by now, the user will return straigh
 to review menu after they give amended information "upstream" in the conversation.
 """
 
-from telegram import InlineKeyboardMarkup, Message, Update
+import re
+
+from telegram import Message, Update
 
 from samanthas_telegram_bot.conversation.auxil.callback_query_reply_sender import (
     CallbackQueryReplySender as CQReplySender,
 )
+from samanthas_telegram_bot.conversation.auxil.constants import EMPTY_INLINE_KEYBOARD
 from samanthas_telegram_bot.conversation.auxil.enums import ConversationStateCommon as CommonState
 from samanthas_telegram_bot.conversation.auxil.enums import (
     ConversationStateTeacherAdult as TeacherState,
 )
+from samanthas_telegram_bot.conversation.auxil.enums import UserDataReviewCategory
 from samanthas_telegram_bot.conversation.auxil.helpers import answer_callback_query_and_get_data
 from samanthas_telegram_bot.conversation.auxil.message_sender import MessageSender
 from samanthas_telegram_bot.data_structures.context_types import CUSTOM_CONTEXT_TYPES
 from samanthas_telegram_bot.data_structures.enums import Role
-from samanthas_telegram_bot.data_structures.literal_types import Locale
 
+_PHRASE_ID_AND_NEXT_STATE_FOR_TEXT_ITEM: dict[str, tuple[str, int]] = {
+    UserDataReviewCategory.FIRST_NAME: ("ask_first_name", CommonState.ASK_LAST_NAME),
+    UserDataReviewCategory.LAST_NAME: ("ask_last_name", CommonState.ASK_SOURCE),
+    UserDataReviewCategory.EMAIL: ("ask_email", CommonState.ASK_AGE_OR_BYE_IF_PERSON_EXISTS),
+}
+TEXT_ITEM_PATTERN = re.compile(f"^({'|'.join(_PHRASE_ID_AND_NEXT_STATE_FOR_TEXT_ITEM)})$")
+"""Pattern for callback data of items processed by `text_item()`."""
 
-async def first_name(update: Update, context: CUSTOM_CONTEXT_TYPES) -> int:
-    query, _ = await answer_callback_query_and_get_data(update)
-    locale: Locale = context.user_data.locale
-
-    message = await query.edit_message_text(
-        context.bot_data.phrases["ask_first_name"][locale],
-        reply_markup=InlineKeyboardMarkup([]),
-    )
-    if isinstance(message, Message):
-        context.chat_data.messages_to_delete_at_review.append(message)
-    return CommonState.ASK_LAST_NAME
 
+async def text_item(update: Update, context: CUSTOM_CONTEXT_TYPES) -> int:
+    """Ask again for an item of data that the user gives by typing it in (e.g. first name).
 
-async def last_name(update: Update, context: CUSTOM_CONTEXT_TYPES) -> int:
-    query, _ = await answer_callback_query_and_get_data(update)
-    locale: Locale = context.user_data.locale
+    All of these items are processed the same way, so one callback with a lookup table
+    replaces a separate callback for each item.
+    """
+    query, data = await answer_callback_query_and_get_data(update)
+    phrase_id, next_state = _PHRASE_ID_AND_NEXT_STATE_FOR_TEXT_ITEM[data]
 
     message = await query.edit_message_text(
-        context.bot_data.phrases["ask_last_name"][locale],
-        reply_markup=InlineKeyboardMarkup([]),
+        context.bot_data.phrases_for_locale[context.user_data.locale][phrase_id],
+        reply_markup=EMPTY_INLINE_KEYBOARD,
     )
     if isinstance(message, Message):
         context.chat_data.messages_to_delete_at_review.append(message)
-    return CommonState.ASK_SOURCE
+    return next_state
 
 
 async def phone(update: Update, context: CUSTOM_CONTEXT_TYPES) -> int:
@@ -58,20 +61,6 @@ async def phone(update: Update, context: CUSTOM_CONTEXT_TYPES) -> int:
     return CommonState.ASK_EMAIL
 
 
-async def email(update: Update, context: CUSTOM_CONTEXT_TYPES) -> int:
-    query, _ = await answer_callback_query_and_get_data(update)
-    locale: Locale = context.user_data.locale
-
-    message = await query.edit_message_text(
-        context.bot_data.phrases["ask_email"][locale],
-        reply_markup=InlineKeyboardMarkup([]),
-    )
-    if isinstance(message, Message):
-        context.chat_data.messages_to_delete_at_review.append(message)
-
-    return CommonState.ASK_AGE_OR_BYE_IF_PERSON_EXISTS
-
-
 async def timezone(update: Update, context: CUSTOM_CONTEXT_TYPES) -> int:
     query, _ = await answer_callback_query_and_get_data(update)
 
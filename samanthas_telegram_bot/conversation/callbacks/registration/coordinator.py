@@ -7,7 +7,11 @@ from samanthas_telegram_bot.conversation.auxil.enums import (
     ConversationStateCommon,
     ConversationStateCoordinator,
 )
-from samanthas_telegram_bot.conversation.auxil.helpers import answer_callback_query_and_get_data
+from samanthas_telegram_bot.conversation.auxil.helpers import (
+    answer_callback_query_and_get_data,
+    ignore_update_without_message,
+    store_utc_offset,
+)
 from samanthas_telegram_bot.conversation.auxil.message_sender import MessageSender
 from samanthas_telegram_bot.data_structures.context_types import CUSTOM_CONTEXT_TYPES
 
@@ -16,12 +20,8 @@ async def store_timezone_ask_communication_language(
     update: Update, context: CUSTOM_CONTEXT_TYPES
 ) -> int:
     """Store timezone, ask about communication language."""
-    user_data = context.user_data
-
     query, data = await answer_callback_query_and_get_data(update)
-    user_data.utc_offset_hour, user_data.utc_offset_minute = (
-        int(item) for item in data.split(":")  # TODO this is repetition, but only one line
-    )
+    store_utc_offset(context, data)
     await CQReplySender.ask_class_communication_languages(context, query)
     return ConversationStateCoordinator.ASK_ADDITIONAL_HELP
 
@@ -38,14 +38,12 @@ async def store_communication_language_ask_additional_help(
     return ConversationStateCoordinator.ASK_REVIEW
 
 
+@ignore_update_without_message
 async def store_additional_help_show_review_menu(
     update: Update, context: CUSTOM_CONTEXT_TYPES
 ) -> int | None:
     """Store info on additional help, show review menu."""
     message = update.message
-    if message is None:
-        return None
-
     context.user_data.volunteer_additional_skills_comment = message.text
 
     await MessageSender.ask_review(update, context)
@@ -7,6 +7,7 @@ from samanthas_telegram_bot.auxil.log_and_notify import logs
 from samanthas_telegram_bot.conversation.auxil.callback_query_reply_sender import (
     CallbackQueryReplySender as CQReplySender,
 )
+from samanthas_telegram_bot.conversation.auxil.constants import EMPTY_INLINE_KEYBOARD
 from samanthas_telegram_bot.conversation.auxil.enums import (
     ConversationMode,
     ConversationStateCommon,
@@ -35,24 +36,25 @@ async def store_age_ask_timezone(update: Update, context: CUSTOM_CONTEXT_TYPES)
     query, data = await answer_callback_query_and_get_data(update)
     user_data = context.user_data
 
+    bot_data = context.bot_data
+
     age_range_id = int(data)
+    age_range = bot_data.student_ages_for_age_range_id[age_range_id]
     user_data.student_age_range_id = age_range_id
-    user_data.student_age_from = context.bot_data.student_ages_for_age_range_id[
-        age_range_id
-    ].age_from
-    user_data.student_age_to = context.bot_data.student_ages_for_age_range_id[age_range_id].age_to
+    user_data.student_age_from = age_range.age_from
+    user_data.student_age_to = age_range.age_to
 
     await logs(
         update=update,
         bot=context.bot,
         text=(
-            f"Age group of the student: ID {user_data.student_age_range_id} "
-            f"({user_data.student_age_from}-{user_data.student_age_to} years old)"
+            f"Age group of the student: ID {age_range_id} "
+            f"({age_range.age_from}-{age_range.age_to} years old)"
         ),
     )
 
     if (
-        context.bot_data.conversation_mode_for_chat_id[context.user_data.chat_id]
+        bot_data.conversation_mode_for_chat_id[user_data.chat_id]
         == ConversationMode.REGISTRATION_REVIEW
     ):
         await MessageSender.delete_message_and_ask_review(update, context)
@@ -236,35 +238,34 @@ async def store_assessment_answer_ask_next_question_or_get_result_if_finished(
     """Stores answer to the question, asks next one. If test is finished, gets result."""
     query, data = await answer_callback_query_and_get_data(update)
 
-    context.user_data.student_assessment_answers.append(
-        AssessmentAnswer(
-            question_id=context.chat_data.current_assessment_question_id,
-            answer_id=int(data),
-        )
+    chat_data = context.chat_data
+    answers = context.user_data.student_assessment_answers
+    questions = chat_data.assessment.questions
+    answer_id = int(data)
+
+    answers.append(
+        AssessmentAnswer(question_id=chat_data.current_assessment_question_id, answer_id=answer_id)
     )
 
     # If user has finished the test: get level and exit assessment
-    if len(context.user_data.student_assessment_answers) == len(
-        context.chat_data.assessment.questions
-    ):
+    if len(answers) == len(questions):
         next_state = await _process_assessment_results(update, context)
         return next_state
 
-    if int(data) in context.chat_data.ids_of_dont_know_options_in_assessment:
+    if answer_id in chat_data.ids_of_dont_know_options_in_assessment:
         await logs(
             update=update,
             bot=context.bot,
             level=LoggingLevel.DEBUG,
             text="User replied 'I don't know'",
         )
-        context.chat_data.assessment_dont_knows_in_a_row += 1
+        chat_data.assessment_dont_knows_in_a_row += 1
     else:
-        context.chat_data.assessment_dont_knows_in_a_row = 0
+        chat_data.assessment_dont_knows_in_a_row = 0
 
-    context.chat_data.current_assessment_question_index += 1
-    context.chat_data.current_assessment_question_id = context.chat_data.assessment.questions[
-        context.chat_data.current_assessment_question_index
-    ].id
+    question_index = chat_data.current_assessment_question_index + 1
+    chat_data.current_assessment_question_index = question_index
+    chat_data.current_assessment_question_id = questions[question_index].id
 
     await CQReplySender.ask_next_assessment_question(context, query)
     return ConversationStateStudent.ASK_QUESTION_IN_TEST_OR_GET_RESULTING_LEVEL
@@ -294,9 +295,7 @@ async def _process_assessment_results(update: Update, context: CUSTOM_CONTEXT_TY
     else:
         # TODO add some compliment on completing the test even without oral test?
         context.user_data.language_and_level_ids = [
-            context.bot_data.language_and_level_id_for_language_id_and_level[
-                (ENGLISH, context.user_data.student_assessment_resulting_level)
-            ]
+            context.bot_data.language_and_level_id_for_language_id_and_level[(ENGLISH, level)]
         ]
         await CQReplySender.ask_class_communication_languages(context, query)
         return ConversationStateStudent.ASK_NON_TEACHING_HELP_OR_START_REVIEW
@@ -403,12 +402,10 @@ async def create_high_level_student(update: Update, context: CUSTOM_CONTEXT_TYPE
     person_was_created = await BackendClient.create_student(update, context)
 
     if person_was_created is True:
-        text = (
-            f"{bot_data.phrases['student_level_too_high_we_will_email_you'][user_data.locale]} "
-            f"{user_data.email}"
-        )
-        await update.effective_message.delete()
-        await update.effective_chat.send_message(text)
+        phrases = bot_data.phrases_for_locale[user_data.locale]
+        text = f"{phrases['student_level_too_high_we_will_email_you']} {user_data.email}"
+        # one request to replace the question (and its buttons) instead of deleting and sending
+        await update.callback_query.edit_message_text(text, reply_markup=EMPTY_INLINE_KEYBOARD)
         await notify_speaking_club_coordinator_about_high_level_student(update, context)
     else:
         await logs(
@@ -12,13 +12,18 @@ from samanthas_telegram_bot.conversation.auxil.enums import (
 )
 from samanthas_telegram_bot.conversation.auxil.helpers import (
     answer_callback_query_and_get_data,
+    ignore_update_without_message,
     store_selected_language_level,
 )
 from samanthas_telegram_bot.conversation.auxil.message_sender import MessageSender
-from samanthas_telegram_bot.data_structures.constants import TEACHER_PEER_HELP_TYPES
+from samanthas_telegram_bot.data_structures.constants import TEACHER_PEER_HELP_BIT_FOR_TYPE
 from samanthas_telegram_bot.data_structures.context_types import CUSTOM_CONTEXT_TYPES
 from samanthas_telegram_bot.data_structures.enums import TeachingMode
 
+_TEACHING_MODES_WITH_SPEAKING_CLUB = frozenset(
+    (TeachingMode.SPEAKING_CLUB_ONLY.value, TeachingMode.BOTH.value)
+)
+
 
 async def store_teaching_language_ask_level(update: Update, context: CUSTOM_CONTEXT_TYPES) -> int:
     """Stores teaching language, asks level."""
@@ -49,6 +54,7 @@ async def ask_next_teaching_language(update: Update, context: CUSTOM_CONTEXT_TYP
 
 async def ask_class_communication_language(update: Update, context: CUSTOM_CONTEXT_TYPES) -> int:
     """Asks for communication language in class. No data is stored here."""
+    user_data = context.user_data
     query, _ = await answer_callback_query_and_get_data(update)
 
     await logs(
@@ -56,19 +62,16 @@ async def ask_class_communication_language(update: Update, context: CUSTOM_CONTE
         bot=context.bot,
         text=(
             "Selected teaching language(s) and level(s): "
-            f"{context.user_data.levels_for_teaching_language} "
-            f"(IDs: {context.user_data.language_and_level_ids})"
+            f"{user_data.levels_for_teaching_language} "
+            f"(IDs: {user_data.language_and_level_ids})"
         ),
     )
 
     if (
-        context.bot_data.conversation_mode_for_chat_id[context.user_data.chat_id]
+        context.bot_data.conversation_mode_for_chat_id[user_data.chat_id]
         == ConversationMode.REGISTRATION_REVIEW
     ):
-        await query.delete_message()
-        await MessageSender.delete_message_and_ask_review(
-            update, context
-        )  # TODO do the same thing in CQReplySender?
+        await MessageSender.delete_message_and_ask_review(update, context)
         return ConversationStateCommon.ASK_FINAL_COMMENT_OR_SHOW_REVIEW_MENU
 
     await CQReplySender.ask_class_communication_languages(context, query)
@@ -89,7 +92,6 @@ async def store_communication_language_ask_teaching_experience(
         context.bot_data.conversation_mode_for_chat_id[context.user_data.chat_id]
         == ConversationMode.REGISTRATION_REVIEW
     ):
-        await query.delete_message()
         await MessageSender.delete_message_and_ask_review(update, context)
         return ConversationStateCommon.ASK_FINAL_COMMENT_OR_SHOW_REVIEW_MENU
 
@@ -120,31 +122,29 @@ async def store_teaching_preference_ask_student_age_or_number_of_groups(
     * If teacher can teach regular groups but has no experience: same
     * If teacher can teach regular groups and has experience, asks about number of groups
     """
+    user_data = context.user_data
 
     query, data = await answer_callback_query_and_get_data(update)
 
-    context.user_data.teacher_can_host_speaking_club = data in (
-        TeachingMode.SPEAKING_CLUB_ONLY,
-        TeachingMode.BOTH,
-    )
+    user_data.teacher_can_host_speaking_club = data in _TEACHING_MODES_WITH_SPEAKING_CLUB
 
     if data == TeachingMode.SPEAKING_CLUB_ONLY:
-        context.user_data.teacher_number_of_groups = 0
-        context.user_data.teacher_class_frequency = 1
+        user_data.teacher_number_of_groups = 0
+        user_data.teacher_class_frequency = 1
         await CQReplySender.ask_teacher_age_groups_of_students(context, query)
         return (
             ConversationStateTeacherAdult.PREFERRED_STUDENT_AGE_GROUPS_MENU_OR_ASK_NON_TEACHING_HELP
         )
 
     # for all regular groups, the teaching frequency is 2 times a week
-    context.user_data.teacher_class_frequency = 2
+    user_data.teacher_class_frequency = 2
 
-    if context.user_data.teacher_has_prior_experience is True:
+    if user_data.teacher_has_prior_experience is True:
         await CQReplySender.ask_teacher_number_of_groups(context, query)
         return ConversationStateTeacherAdult.PREFERRED_STUDENT_AGE_GROUPS_START
 
     # inexperienced teacher only get one group
-    context.user_data.teacher_number_of_groups = 1
+    user_data.teacher_number_of_groups = 1
     await CQReplySender.ask_teacher_age_groups_of_students(context, query)
     return ConversationStateTeacherAdult.PREFERRED_STUDENT_AGE_GROUPS_MENU_OR_ASK_NON_TEACHING_HELP
 
@@ -185,7 +185,6 @@ async def ask_non_teaching_help(update: Update, context: CUSTOM_CONTEXT_TYPES) -
         context.bot_data.conversation_mode_for_chat_id[context.user_data.chat_id]
         == ConversationMode.REGISTRATION_REVIEW
     ):
-        await query.delete_message()
         await MessageSender.delete_message_and_ask_review(update, context)
         return ConversationStateCommon.ASK_FINAL_COMMENT_OR_SHOW_REVIEW_MENU
 
@@ -221,7 +220,9 @@ async def store_peer_help_ask_another(update: Update, context: CUSTOM_CONTEXT_TY
     query, type_of_peer_help = await answer_callback_query_and_get_data(update)
 
     setattr(context.user_data.teacher_peer_help, type_of_peer_help, True)
-    context.chat_data.peer_help_callback_data.add(type_of_peer_help)
+    context.chat_data.selected_peer_help_types_mask |= TEACHER_PEER_HELP_BIT_FOR_TYPE[
+        type_of_peer_help
+    ]
 
     await CQReplySender.ask_teacher_peer_help(context, query)
     return ConversationStateTeacherAdult.PEER_HELP_MENU_OR_ASK_ADDITIONAL_HELP
@@ -230,12 +231,12 @@ async def store_peer_help_ask_another(update: Update, context: CUSTOM_CONTEXT_TY
 async def ask_additional_skills_comment(update: Update, context: CUSTOM_CONTEXT_TYPES) -> int:
     """Asks for any additional skills (in free text)."""
     query, data = await answer_callback_query_and_get_data(update)
-    user_data = context.user_data
+    selected_types_mask = context.chat_data.selected_peer_help_types_mask
 
     selected_types = ", ".join(
         help_type
-        for help_type in TEACHER_PEER_HELP_TYPES
-        if getattr(user_data.teacher_peer_help, help_type) is True
+        for help_type, bit in TEACHER_PEER_HELP_BIT_FOR_TYPE.items()
+        if selected_types_mask & bit
     )
     await logs(
         update=update,
@@ -247,13 +248,11 @@ async def ask_additional_skills_comment(update: Update, context: CUSTOM_CONTEXT_
     return ConversationStateTeacherAdult.ASK_REVIEW
 
 
+@ignore_update_without_message
 async def store_additional_skills_comment_ask_review(
     update: Update, context: CUSTOM_CONTEXT_TYPES
 ) -> int | None:
     """Stores teacher's comment on additional skills and asks to review main user data."""
-    if update.message is None:
-        return None
-
     context.user_data.volunteer_additional_skills_comment = update.message.text
 
     await MessageSender.delete_message_and_ask_review(update, context)
@@ -4,11 +4,15 @@ from samanthas_telegram_bot.auxil.log_and_notify import logs
 from samanthas_telegram_bot.conversation.auxil.callback_query_reply_sender import (
     CallbackQueryReplySender as CQReplySender,
 )
+from samanthas_telegram_bot.conversation.auxil.constants import EMPTY_INLINE_KEYBOARD
 from samanthas_telegram_bot.conversation.auxil.enums import (
     ConversationStateCommon,
     ConversationStateTeacherUnder18,
 )
-from samanthas_telegram_bot.conversation.auxil.helpers import answer_callback_query_and_get_data
+from samanthas_telegram_bot.conversation.auxil.helpers import (
+    answer_callback_query_and_get_data,
+    ignore_update_without_message,
+)
 from samanthas_telegram_bot.data_structures.context_types import CUSTOM_CONTEXT_TYPES
 from samanthas_telegram_bot.data_structures.literal_types import Locale
 
@@ -40,7 +44,6 @@ async def store_speaking_club_language_ask_additional_skills_comment(
 ) -> int:
     """Stores teaching language, asks additional skills."""
     query, lang_id = await answer_callback_query_and_get_data(update)
-    await query.delete_message()
 
     await logs(
         update=update,
@@ -59,8 +62,11 @@ async def store_speaking_club_language_ask_additional_skills_comment(
     ]
     locale: Locale = user_data.locale
 
-    await update.effective_chat.send_message(
-        context.bot_data.phrases["ask_teacher_any_additional_help"][locale]
+    # Replacing the question with the next one takes one request instead of deleting the message
+    # and sending a new one.  The buttons are removed along with the old text.
+    await query.edit_message_text(
+        context.bot_data.phrases_for_locale[locale]["ask_teacher_any_additional_help"],
+        reply_markup=EMPTY_INLINE_KEYBOARD,
     )
     return ConversationStateTeacherUnder18.ASK_FINAL_COMMENT
 
@@ -69,21 +75,20 @@ class CommonState:
     pass
 
 
+@ignore_update_without_message
 async def store_additional_help_comment_ask_final_comment(
     update: Update, context: CUSTOM_CONTEXT_TYPES
 ) -> int | None:
     """For young teachers: stores comment on additional help, asks for final comment."""
-    if update.message is None:
-        return None
-    locale: Locale = context.user_data.locale
+    user_data = context.user_data
+    phrases = context.bot_data.phrases_for_locale[user_data.locale]
 
-    context.user_data.volunteer_additional_skills_comment = update.message.text
+    user_data.volunteer_additional_skills_comment = update.message.text
 
     # We want to give the young teacher the opportunity to double-check their email
     # without starting a full-fledged review
     await update.message.reply_text(
-        f"{context.bot_data.phrases['young_teacher_we_will_email_you'][locale]} "
-        f"{context.user_data.email}\n\n"
-        f"{context.bot_data.phrases['ask_final_comment'][locale]}"
+        f"{phrases['young_teacher_we_will_email_you']} {user_data.email}\n\n"
+        f"{phrases['ask_final_comment']}"
     )
     return ConversationStateCommon.FINISH_REGISTRATION
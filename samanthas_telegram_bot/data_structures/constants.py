@@ -9,16 +9,16 @@ from samanthas_telegram_bot.data_structures.literal_types import Locale
 #  are used to identify the phrases).
 #  Maybe this can be changed anyway (not necessarily in MVP).
 #  We could check ID's of phrases at the start to make sure there's no mismatch.
-LOW_LEVELS = ("A0", "A1")
+LOW_LEVELS = frozenset(("A0", "A1"))
 # Higher levels can technically pass oral test too, but it was decided not to send students to
 # SmallTalk if their levels are too high for regular classes after "written" assessment.
-LEVELS_ELIGIBLE_FOR_ORAL_TEST = ("A2", "B1")
-LEVELS_TOO_HIGH = ("B2", "C1", "C2")
+LEVELS_ELIGIBLE_FOR_ORAL_TEST = frozenset(("A2", "B1"))
+LEVELS_TOO_HIGH = frozenset(("B2", "C1", "C2"))
 """These levels mean that the student will only be able to attend Speaking Club sessions,
 not regular classes."""
-ALL_LEVELS = LOW_LEVELS + LEVELS_ELIGIBLE_FOR_ORAL_TEST + LEVELS_TOO_HIGH
+ALL_LEVELS = LOW_LEVELS | LEVELS_ELIGIBLE_FOR_ORAL_TEST | LEVELS_TOO_HIGH
 # in reality, not all of these levels will be taught at the school but it's OK for the pattern
-ALL_LEVELS_PATTERN = re.compile(r"^(A[012])|([BC][12])$")
+ALL_LEVELS_PATTERN = re.compile(r"^(?:A[012]|[BC][12])$")
 
 ENGLISH: Locale = "en"
 RUSSIAN: Locale = "ru"
@@ -52,3 +52,20 @@ TEACHER_PEER_HELP_TYPES = (
     "can_work_in_tandem",
 )
 """These types are used in `UserData`, callback data, setting boolean flags for teacher."""
+
+TEACHER_PEER_HELP_BIT_FOR_TYPE = {
+    help_type: 1 << index for index, help_type in enumerate(TEACHER_PEER_HELP_TYPES)
+}
+"""Bits to mark types of peer help selected by the teacher in a single integer."""
+
+UTC_OFFSETS_FOR_TIMEZONE_BUTTONS: tuple[tuple[tuple[int, int], ...], ...] = (
+    ((-8, 0), (-7, 0), (-6, 0)),
+    ((-5, 0), (-4, 0), (-3, 0)),
+    ((-1, 0), (0, 0), (1, 0)),
+    ((2, 0), (3, 0), (4, 0)),
+    ((5, 30), (7, 0)),
+    ((8, 0), (9, 0), (10, 0)),
+    ((11, 0), (12, 0), (13, 0)),
+)
+"""UTC offsets (hours and minutes) the user can choose their timezone from,
+grouped into rows of buttons."""
@@ -1,9 +1,16 @@
 """Module with context types to be used with python-telegram-bot instead of plain dictionaries."""
 
 import json
-from dataclasses import dataclass
-
-from telegram import Message, Update
+from dataclasses import dataclass, field
+from typing import Any
+
+from telegram import (
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    Message,
+    ReplyKeyboardMarkup,
+    Update,
+)
 from telegram.ext import CallbackContext, ExtBot
 
 from samanthas_telegram_bot.api_clients.auxil.constants import DataDict
@@ -13,6 +20,7 @@ from samanthas_telegram_bot.auxil.constants import (
     PROJECT_STATUS_FOR_STUDENTS_THAT_NEED_INTERVIEW,
 )
 from samanthas_telegram_bot.conversation.auxil.enums import ConversationMode
+from samanthas_telegram_bot.data_structures.constants import TEACHER_PEER_HELP_BIT_FOR_TYPE
 from samanthas_telegram_bot.data_structures.enums import AgeRangeType, Role
 from samanthas_telegram_bot.data_structures.literal_types import CommunicationModeInClass, Locale
 from samanthas_telegram_bot.data_structures.models import (
@@ -22,6 +30,7 @@ from samanthas_telegram_bot.data_structures.models import (
     DayAndTimeSlot,
     LanguageAndLevel,
     MultilingualBotPhrase,
+    SlotsWithPersistence,
     SmalltalkResult,
     TeacherPeerHelp,
 )
@@ -42,6 +51,55 @@ class BotData:
     age_ranges_for_type: dict[AgeRangeType, tuple[AgeRange, ...]] | None = None
     assessment_for_age_range_id: dict[int, Assessment] | None = None
 
+    # Buttons that only depend on locale (and role) are created once at startup.
+    # Buttons are immutable, so they can safely be shared between all conversations.
+    buttons_class_communication_language_for_locale_and_role: (
+        dict[tuple[Locale, Role], tuple[InlineKeyboardButton, ...]] | None
+    ) = None
+    """Matches locale and role to buttons with languages of communication in class.
+    Only teachers can choose "L2 only"."""
+
+    buttons_disclaimer_for_locale: dict[Locale, tuple[InlineKeyboardButton, ...]] | None = None
+    """Matches locale to buttons for accepting or declining a disclaimer."""
+
+    buttons_how_long_been_learning_english_for_locale: (
+        dict[Locale, tuple[InlineKeyboardButton, ...]] | None
+    ) = None
+    """Matches locale to buttons with options for how long a student has been learning English."""
+
+    buttons_non_teaching_help_for_locale: dict[Locale, tuple[InlineKeyboardButton, ...]] | None = (
+        None
+    )
+    """Matches locale to buttons with all types of non-teaching help."""
+
+    buttons_number_of_groups_for_locale: dict[Locale, tuple[InlineKeyboardButton, ...]] | None = (
+        None
+    )
+    """Matches locale to buttons with number of groups a teacher can take."""
+
+    buttons_review_category_for_locale_role_and_phone: (
+        dict[tuple[Locale, Role, bool], tuple[InlineKeyboardButton, ...]] | None
+    ) = None
+    """Matches locale, role and whether the user has given their phone number to buttons with
+    categories of data the user can change during the review."""
+
+    buttons_role_for_locale: dict[Locale, tuple[InlineKeyboardButton, ...]] | None = None
+    """Matches locale to buttons with roles the user can choose."""
+
+    buttons_teacher_peer_help_for_locale: dict[Locale, tuple[InlineKeyboardButton, ...]] | None = (
+        None
+    )
+    """Matches locale to buttons with all types of teachers' peer help."""
+
+    buttons_teacher_student_age_range_for_locale: (
+        dict[Locale, tuple[InlineKeyboardButton, ...]] | None
+    ) = None
+    """Matches locale to buttons with age ranges of students a teacher can choose."""
+
+    buttons_teaching_mode_for_locale: dict[Locale, tuple[InlineKeyboardButton, ...]] | None = None
+    """Matches locale to buttons with options for teaching regular groups and/or hosting
+    speaking clubs."""
+
     conversation_mode_for_chat_id: dict[int, ConversationMode] | None = None
     """Used to store conversation modes each chat is in. This data cannot be stored
     in individual ``chat_id`` because ``.chat_id`` will be different for different contexts
@@ -56,14 +114,35 @@ class BotData:
     what they have chosen)
      """
 
-    day_and_time_slots_for_day_index: dict[int, tuple[DayAndTimeSlot, ...]] | None = None
-    """Matches indexes of days of the week to `DayAndTimeSlot` objects. We ask the user
-    time slots day by day, so for each day we have to select slots with the correct day index.
+    day_and_time_slots_for_day_index: tuple[tuple[DayAndTimeSlot, ...], ...] | None = None
+    """Contains `DayAndTimeSlot` objects for each day of the week, indexed by day index
+    (0 is Monday). We ask the user time slots day by day, so for each day we have to select
+    slots with the correct day index.
      """
 
+    greeting_template: str | None = None
+    """Greeting and question on language of conversation in all locales. Contains ``{name}``
+    placeholder to be filled with user's first name by ``str.format()``."""
+
     sorted_language_ids: list[str] | None = None
     """Language IDs sorted by language code (but English always comes first)."""
 
+    keyboard_share_phone_for_locale: dict[Locale, ReplyKeyboardMarkup] | None = None
+    """Matches locale to keyboard with a button to share phone number."""
+
+    keyboard_start_assessment_for_locale: dict[Locale, InlineKeyboardMarkup] | None = None
+    """Matches locale to keyboard with a button to start the assessment."""
+
+    keyboard_store_username_for_locale: dict[Locale, InlineKeyboardMarkup] | None = None
+    """Matches locale to keyboard asking the user whether their username can be stored."""
+
+    keyboard_review_reaction_for_locale: dict[Locale, InlineKeyboardMarkup] | None = None
+    """Matches locale to keyboard asking the user whether their data shown for review
+    is correct."""
+
+    keyboard_yes_no_for_locale: dict[Locale, InlineKeyboardMarkup] | None = None
+    """Matches locale to keyboard with buttons "Yes" and "No" in one row."""
+
     language_and_level_for_id: dict[int, LanguageAndLevel] | None = None
     """Matches IDs of `LanguageAndLevel` objects to same `LanguageAndLevel` objects."""
 
@@ -83,12 +162,16 @@ class BotData:
     phrases: dict[str, MultilingualBotPhrase] | None = None
     """Matches internal ID of a bot phrase to localized versions of this phrase."""
 
+    phrases_for_locale: dict[Locale, dict[str, str]] | None = None
+    """Matches locale to a dictionary of all bot phrases in this locale. Useful for building
+    long messages in one language, where every phrase would otherwise be indexed twice."""
+
     student_ages_for_age_range_id: dict[int, AgeRange] | None = None
     """Matches IDs of students' age ranges to the same `AgeRange` objects."""
 
 
-@dataclass
-class ChatData:
+@dataclass(slots=True)
+class ChatData(SlotsWithPersistence):
     """Class for data only relevant for one particular conversation."""
 
     # assessment flow
@@ -99,8 +182,9 @@ class ChatData:
 
     # for tracking of "Don't know"s during assessment
     assessment_dont_knows_in_a_row: int | None = None
-    ids_of_dont_know_options_in_assessment: set[int] | None = None
-    """IDs of all question options whose text is 'I don't know'."""
+    ids_of_dont_know_options_in_assessment: frozenset[int] | None = None
+    """IDs of all question options whose text is 'I don't know'. Shared with `Assessment`
+    in bot data, so it must not be modified."""
 
     # misc
     messages_to_delete_at_review: list[Message] | None = None
@@ -112,28 +196,33 @@ class ChatData:
     about the first name should be deleted too. Since it's not ``effective_message`` anymore,
     we have to keep track of it.  
     """
-    peer_help_callback_data: set[str] | None = None
-    """Names of callback data for peer help types selected by the user. It is not passed
-    to the backend, only used to control the buttons and check number of options selected. 
+    selected_peer_help_types_mask: int = 0
+    """Bit mask of peer help types selected by the user (see `TEACHER_PEER_HELP_BIT_FOR_TYPE`).
+    It is not passed to the backend, only used to control the buttons.
     """
 
     def reset(self) -> None:
         set_public_attrs_to_none(self)
 
-        self.ids_of_dont_know_options_in_assessment = set()
+        self.ids_of_dont_know_options_in_assessment = frozenset()
         self.messages_to_delete_at_review = []
 
         # We will be storing the selected options in boolean flags of TeacherPeerHelp(),
-        # but in order to remove selected options from InlineKeyboard, I have to store exact
-        # callback_data somewhere.
-        self.peer_help_callback_data = set()
+        # but in order to quickly remove selected options from InlineKeyboard,
+        # they are also marked in a bit mask.
+        self.selected_peer_help_types_mask = 0
 
         # set day of week to Monday to start asking about slots for each day
         self.day_index = 0
 
+    def _restore_legacy_state(self, state: dict[str, Any]) -> None:
+        # Before the bit mask was introduced, selected types of peer help were stored in a set.
+        for help_type in state.get("peer_help_callback_data") or ():
+            self.selected_peer_help_types_mask |= TEACHER_PEER_HELP_BIT_FOR_TYPE[help_type]
 
-@dataclass
-class UserData:
+
+@dataclass(slots=True)
+class UserData(SlotsWithPersistence):
     """Class for data pertaining to the user that will be sent to backend."""
 
     locale: Locale | None = None
@@ -185,7 +274,7 @@ class UserData:
     teacher_class_frequency: int | None = None
     teacher_student_age_range_ids: list[int] | None = None
     teacher_can_host_speaking_club: bool | None = None
-    teacher_peer_help = TeacherPeerHelp()
+    teacher_peer_help: TeacherPeerHelp = field(default_factory=TeacherPeerHelp)
     volunteer_additional_skills_comment: str | None = None  # for both teachers and coordinators
 
     def coordinator_as_dict(self, update: Update, personal_info_id: int) -> DataDict:
@@ -224,8 +313,15 @@ class UserData:
         self.language_and_level_ids = []
         self.levels_for_teaching_language = {}
         self.non_teaching_help_types = []
+        self.teacher_peer_help = TeacherPeerHelp()
         self.teacher_student_age_range_ids = []
 
+    def _restore_legacy_state(self, state: dict[str, Any]) -> None:
+        # Peer help used to be a class attribute, so older users have no peer help of their own
+        # or have None that `reset()` assigned to it.
+        if state.get("teacher_peer_help") is None:
+            self.teacher_peer_help = TeacherPeerHelp()
+
     def student_as_dict(self, update: Update, personal_info_id: int) -> DataDict:
         project_status = (
             PROJECT_STATUS_FOR_STUDENTS_THAT_NEED_INTERVIEW
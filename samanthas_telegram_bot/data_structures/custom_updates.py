@@ -49,7 +49,12 @@ class ChatwootUpdate:
 
         self.chatwoot_conversation_id = data[top_key]["id"]  # type:ignore[index]
 
-        logger.debug(f"{self.chat_id=}, {self.chatwoot_conversation_id=}, {data=}")
+        logger.debug(
+            "self.chat_id=%r, self.chatwoot_conversation_id=%r, data=%r",
+            self.chat_id,
+            self.chatwoot_conversation_id,
+            data,
+        )
 
         # TODO do I need to check message_type for some reason?
         #  I may also want to use data["conversation"]["status"] (open or something else)
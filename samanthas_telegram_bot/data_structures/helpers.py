@@ -0,0 +1,32 @@
+"""Helper functions related to business logic."""
+
+from samanthas_telegram_bot.conversation.auxil.enums import UserDataReviewCategory
+from samanthas_telegram_bot.data_structures.enums import Role
+
+
+def get_review_categories(role: Role, has_phone_number: bool) -> tuple[str, ...]:
+    """Returns categories of data the user with given role can change during the review."""
+    categories = [
+        UserDataReviewCategory.FIRST_NAME,
+        UserDataReviewCategory.LAST_NAME,
+        UserDataReviewCategory.EMAIL,
+        UserDataReviewCategory.CLASS_COMMUNICATION_LANGUAGE,
+        UserDataReviewCategory.TIMEZONE,
+    ]
+
+    if role != Role.COORDINATOR:
+        categories.append(UserDataReviewCategory.DAY_AND_TIME_SLOTS)
+
+    if has_phone_number:
+        categories.append(UserDataReviewCategory.PHONE_NUMBER)
+
+    if role == Role.STUDENT:
+        categories.append(UserDataReviewCategory.STUDENT_AGE_GROUPS)
+
+    # Because of complex logic around English, we will not offer the student to review their
+    # language/level for now.  This option will be reserved for teachers.
+    if role == Role.TEACHER:
+        categories.append(UserDataReviewCategory.LANGUAGES_AND_LEVELS)
+        # TODO review preferred students' ages?
+
+    return tuple(category.value for category in categories)
@@ -3,8 +3,9 @@
 Most of the classes correspond to models in the backend.
 """
 
-from dataclasses import dataclass
-from typing import Optional, TypedDict
+import functools
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Any, Optional, TypedDict
 
 from samanthas_telegram_bot.api_clients.auxil.constants import DataDict
 from samanthas_telegram_bot.api_clients.auxil.enums import SmalltalkTestStatus
@@ -12,8 +13,45 @@ from samanthas_telegram_bot.auxil.constants import WEEKDAYS
 from samanthas_telegram_bot.data_structures.enums import AgeRangeType
 
 
-@dataclass
-class AgeRange:
+class SlotsWithPersistence:
+    """Base class for dataclasses with ``__slots__`` that are stored by ``PicklePersistence``.
+
+    Objects stored in persistence before ``__slots__`` were introduced were pickled with their
+    ``__dict__``. Their state is restored into slots on top of default values. Attributes
+    that no longer exist are skipped, but subclasses can convert them
+    in `_restore_legacy_state`.
+
+    Not suitable for frozen dataclasses: ``dataclass(frozen=True, slots=True)`` replaces
+    ``__setstate__`` with its own.
+    """
+
+    __slots__ = ()
+
+    def __setstate__(self, state: dict[str, Any] | tuple[None, dict[str, Any]]) -> None:
+        if isinstance(state, tuple):
+            _, state = state
+
+        for field_ in fields(self):  # type: ignore[arg-type]
+            if field_.default is not MISSING:
+                setattr(self, field_.name, field_.default)
+            elif field_.default_factory is not MISSING:
+                setattr(self, field_.name, field_.default_factory())
+
+        for name, value in state.items():
+            if name in self.__slots__:
+                setattr(self, name, value)
+
+        self._restore_legacy_state(state)
+
+    def _restore_legacy_state(self, state: dict[str, Any]) -> None:
+        """Converts attributes that were stored differently in older versions of the bot.
+
+        Called after the current attributes have been restored. Does nothing by default.
+        """
+
+
+@dataclass(slots=True)
+class AgeRange(SlotsWithPersistence):
     id: int
     age_from: int
     age_to: int
@@ -21,8 +59,8 @@ class AgeRange:
     bot_phrase_id: Optional[str] = None
 
 
-@dataclass
-class AssessmentAnswer:
+@dataclass(slots=True)
+class AssessmentAnswer(SlotsWithPersistence):
     question_id: int
     answer_id: int
 
@@ -48,10 +86,26 @@ class Assessment:
     id: int
     age_range_ids: tuple[int, ...]
     questions: tuple[AssessmentQuestion, ...]
-
-
-@dataclass
-class DayAndTimeSlot:
+    ids_of_dont_know_options: frozenset[int] = field(init=False)
+    """IDs of all question options whose text is 'I don't know'. Calculated once when
+    the assessment is created, so that they don't have to be found for every student."""
+
+    def __post_init__(self) -> None:
+        # the dataclass is frozen, so the attribute cannot be set in a usual way
+        object.__setattr__(
+            self,
+            "ids_of_dont_know_options",
+            frozenset(
+                option.id
+                for question in self.questions
+                for option in question.options
+                if option.means_user_does_not_know_the_answer()
+            ),
+        )
+
+
+@dataclass(slots=True)
+class DayAndTimeSlot(SlotsWithPersistence):
     id: int
     day_of_week_index: int
     from_utc_hour: int
@@ -60,6 +114,26 @@ class DayAndTimeSlot:
     def __str__(self) -> str:
         return f"{WEEKDAYS[self.day_of_week_index]} {self.from_utc_hour}-{self.to_utc_hour} UTC"
 
+    def label_for_utc_offset(self, offset_hour: int, offset_minute: int) -> str:
+        """Returns the slot's time range shifted to the given UTC offset, e.g. "5:30-8:30"."""
+        return _format_time_range(self.from_utc_hour, self.to_utc_hour, offset_hour, offset_minute)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_time_range(
+    from_utc_hour: int, to_utc_hour: int, offset_hour: int, offset_minute: int
+) -> str:
+    """Formats a time range for the given UTC offset.
+
+    There are only a few dozen slots and timezones, so the labels are cached instead of being
+    formatted anew for every keyboard and review message.
+    """
+    # % 24 is needed to avoid showing 22:00-25:00 to the user
+    return (
+        f"{(from_utc_hour + offset_hour) % 24}:{offset_minute:02d}-"
+        f"{(to_utc_hour + offset_hour) % 24}:{offset_minute:02d}"
+    )
+
 
 @dataclass(frozen=True)
 class LanguageAndLevel:
@@ -83,8 +157,8 @@ class SmalltalkResult:
     json: DataDict | None = None
 
 
-@dataclass
-class TeacherPeerHelp:
+@dataclass(slots=True)
+class TeacherPeerHelp(SlotsWithPersistence):
     """A class that comprises boolean flags for experienced teachers' willingness to help their
     peers.
     """
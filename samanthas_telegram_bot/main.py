@@ -13,6 +13,7 @@ from starlette.routing import Route
 from telegram import BotCommandScopeAllPrivateChats, Update
 from telegram.constants import ParseMode
 from telegram.ext import (
+    AIORateLimiter,
     Application,
     CommandHandler,
     ContextTypes,
@@ -104,7 +105,7 @@ async def error_handler(update: Update, context: CUSTOM_CONTEXT_TYPES) -> None:
 
 
 async def post_init(application: Application) -> None:
-    BotDataLoader.load(application.bot_data)
+    await BotDataLoader.load(application.bot_data)
 
     await application.bot.delete_my_commands(scope=BotCommandScopeAllPrivateChats())
     await application.bot.set_my_commands(
@@ -188,6 +189,7 @@ async def main() -> None:
         # the updates and hence we don't need an Updater instance
         .updater(None)
         .context_types(context_types)
+        .rate_limiter(AIORateLimiter())
         .build()
     )
 
@@ -226,4 +228,13 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    # The bot only does network I/O, so it benefits from a faster event loop.
+    # uvloop is not a required dependency (e.g. it does not support Windows): use it if installed.
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     asyncio.run(main())
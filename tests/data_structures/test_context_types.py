@@ -0,0 +1,88 @@
+import io
+import pickle
+
+# api_clients go first: importing context_types on its own runs into a circular import
+import samanthas_telegram_bot.api_clients  # noqa: F401
+
+# isort: split
+from samanthas_telegram_bot.data_structures.constants import TEACHER_PEER_HELP_BIT_FOR_TYPE
+from samanthas_telegram_bot.data_structures.context_types import ChatData, UserData
+from samanthas_telegram_bot.data_structures.models import TeacherPeerHelp
+
+
+class _UserDataBeforeSlots:
+    """Stands in for `UserData` as it was pickled before it had ``__slots__``."""
+
+    def __init__(self, **attrs):
+        self.__dict__.update(attrs)
+
+
+class _ChatDataBeforeSlots(_UserDataBeforeSlots):
+    """Stands in for `ChatData` as it was pickled before it had ``__slots__``."""
+
+
+class _Unpickler(pickle.Unpickler):
+    _CLASS_FOR_STAND_IN = {
+        _ChatDataBeforeSlots.__name__: ChatData,
+        _UserDataBeforeSlots.__name__: UserData,
+    }
+
+    def find_class(self, module, name):
+        if name in self._CLASS_FOR_STAND_IN:
+            return self._CLASS_FOR_STAND_IN[name]
+        return super().find_class(module, name)
+
+
+def _load_from_old_persistence(obj):
+    return _Unpickler(io.BytesIO(pickle.dumps(obj))).load()
+
+
+def test_user_data_from_old_persistence_gets_teacher_peer_help():
+    # `reset()` used to set the class attribute `teacher_peer_help` to None
+    user_data = _load_from_old_persistence(
+        _UserDataBeforeSlots(locale="en", first_name="Ann", teacher_peer_help=None)
+    )
+
+    assert isinstance(user_data, UserData)
+    assert user_data.locale == "en"
+    assert user_data.first_name == "Ann"
+    assert isinstance(user_data.teacher_peer_help, TeacherPeerHelp)
+
+
+def test_user_data_from_old_persistence_without_teacher_peer_help():
+    user_data = _load_from_old_persistence(_UserDataBeforeSlots(locale="en"))
+
+    assert isinstance(user_data.teacher_peer_help, TeacherPeerHelp)
+
+
+def test_user_data_keeps_teacher_peer_help_on_pickling():
+    user_data = UserData()
+    user_data.teacher_peer_help.can_give_feedback = True
+
+    restored = pickle.loads(pickle.dumps(user_data))
+
+    assert restored.teacher_peer_help.can_give_feedback is True
+
+
+def test_user_data_reset_gives_fresh_teacher_peer_help():
+    user_data = UserData()
+    user_data.teacher_peer_help.can_give_feedback = True
+
+    user_data.reset()
+
+    assert user_data.teacher_peer_help == TeacherPeerHelp()
+
+
+def test_chat_data_from_old_persistence_keeps_selected_peer_help_types():
+    chat_data = _load_from_old_persistence(
+        _ChatDataBeforeSlots(
+            day_index=2, peer_help_callback_data={"can_give_feedback", "can_check_syllabus"}
+        )
+    )
+
+    assert isinstance(chat_data, ChatData)
+    assert chat_data.day_index == 2
+    assert chat_data.selected_peer_help_types_mask == (
+        TEACHER_PEER_HELP_BIT_FOR_TYPE["can_give_feedback"]
+        | TEACHER_PEER_HELP_BIT_FOR_TYPE["can_check_syllabus"]
+    )